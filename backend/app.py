@@ -10,12 +10,36 @@ import os
 import sys
 import io
 import json
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from PIL import Image
 import requests
 
-from plex_scanner_api import PlexScannerAPI, detect_plex_url
+from plex_scanner_api import PlexScannerAPI, detect_plex_url, serialize_item
 from file_manager import FileManager
 
+# Scanner logs go to stdout alongside the server's own output (after the UTF-8
+# console fix applied by plex_scanner_api). Set PPM_LOG_LEVEL=DEBUG for per-item details.
+# Scan worker threads only enqueue records; a single listener thread does the writing.
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+LOG_LEVEL = os.environ.get('PPM_LOG_LEVEL', 'INFO').upper()
+# getLevelName() maps a known level name to its number and anything else to a string
+LOG_LEVEL_VALID = isinstance(logging.getLevelName(LOG_LEVEL), int)
+logging.basicConfig(
+    level=LOG_LEVEL if LOG_LEVEL_VALID else logging.INFO,
+    format='%(message)s',
+    handlers=[QueueHandler(log_queue)]
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logger = logging.getLogger(__name__)
+if not LOG_LEVEL_VALID:
+    logger.warning(f"[app] Ignoring invalid PPM_LOG_LEVEL={os.environ['PPM_LOG_LEVEL']!r}, using INFO")
+
 app = Flask(__name__)
 CORS(app)
 
@@ -70,14 +94,14 @@ def update_config():
     """Update configuration."""
     global config, scanner
 
-    print("\n[API /api/config POST] Updating configuration...")
+    logger.info("[API /api/config POST] Updating configuration...")
 
     try:
         data = request.json
-        print(f"[API /api/config POST] Received data: {data}")
+        logger.info(f"[API /api/config POST] Received data: {data}")
 
         if not data:
-            print(f"[API /api/config POST] ERROR: No data received")
+            logger.error(f"[API /api/config POST] ERROR: No data received")
             return jsonify({
                 "success": False,
                 "error": "No configuration data provided"
@@ -86,7 +110,7 @@ def update_config():
         # Update config
         config.update(data)
         save_config()
-        print(f"[API /api/config POST] Configuration saved")
+        logger.info(f"[API /api/config POST] Configuration saved")
 
         # Reinitialize scanner if URL or token changed
         if 'plex_url' in data or 'plex_token' in data:
@@ -94,29 +118,31 @@ def update_config():
             plex_token = config.get('plex_token', '')
 
             if not plex_token:
-                print(f"[API /api/config POST] WARNING: No Plex token provided")
+                logger.warning(f"[API /api/config POST] WARNING: No Plex token provided")
                 return jsonify({
                     "success": False,
                     "error": "Plex token is REQUIRED for API-based scanning. Please provide a valid token."
                 }), 400
 
-            print(f"[API /api/config POST] Initializing API scanner with URL: {plex_url}")
+            logger.info(f"[API /api/config POST] Initializing API scanner with URL: {plex_url}")
+            if scanner:
+                scanner.close()
             scanner = PlexScannerAPI(plex_url, plex_token)
 
             if not scanner.connect():
-                print(f"[API /api/config POST] WARNING: Connection to Plex failed")
+                logger.warning(f"[API /api/config POST] WARNING: Connection to Plex failed")
                 return jsonify({
                     "success": False,
                     "error": "Could not connect to Plex server. Check URL and token."
                 }), 400
 
-            print(f"[API /api/config POST] Scanner initialized successfully")
+            logger.info(f"[API /api/config POST] Scanner initialized successfully")
 
-        print(f"[API /api/config POST] [OK] Configuration updated successfully")
+        logger.info(f"[API /api/config POST] [OK] Configuration updated successfully")
         return jsonify({"success": True, "config": config})
 
     except Exception as e:
-        print(f"[API /api/config POST] ERROR: {e}")
+        logger.error(f"[API /api/config POST] ERROR: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -128,25 +154,25 @@ def update_config():
 @app.route('/api/detect-path', methods=['GET'])
 def auto_detect_path():
     """Auto-detect Plex server URL."""
-    print("\n[API /api/detect-path] Auto-detecting Plex server URL...")
+    logger.info("[API /api/detect-path] Auto-detecting Plex server URL...")
 
     try:
         detected_url = detect_plex_url()
 
         if detected_url:
-            print(f"[API /api/detect-path] Found URL: {detected_url}")
+            logger.info(f"[API /api/detect-path] Found URL: {detected_url}")
             return jsonify({
                 "success": True,
                 "url": detected_url
             })
         else:
-            print(f"[API /api/detect-path] No URL found")
+            logger.info(f"[API /api/detect-path] No URL found")
             return jsonify({
                 "success": False,
                 "error": "Could not auto-detect Plex server"
             }), 404
     except Exception as e:
-        print(f"[API /api/detect-path] ERROR: {e}")
+        logger.error(f"[API /api/detect-path] ERROR: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -244,18 +270,18 @@ def test_plex_token():
 @app.route('/api/libraries', methods=['GET'])
 def get_libraries():
     """Get list of available Plex libraries."""
-    print("\n[API /api/libraries] Getting libraries...")
+    logger.info("[API /api/libraries] Getting libraries...")
 
     if not scanner:
-        print("[API /api/libraries] ERROR: Scanner not initialized")
+        logger.error("[API /api/libraries] ERROR: Scanner not initialized")
         return jsonify({"error": "Plex scanner not initialized. Please configure URL and token."}), 400
 
     try:
         libraries = scanner.get_libraries()
-        print(f"[API /api/libraries] Returning {len(libraries)} libraries: {libraries}")
+        logger.info(f"[API /api/libraries] Returning {len(libraries)} libraries: {libraries}")
         return jsonify({"libraries": libraries})
     except Exception as e:
-        print(f"[API /api/libraries] ERROR: {e}")
+        logger.error(f"[API /api/libraries] ERROR: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({"error": str(e), "libraries": []}), 500
@@ -278,9 +304,9 @@ def scan_library():
     offset = data.get('offset', 0)  # Start position for pagination
 
     if limit:
-        print(f"\n[API /api/scan] Scanning library: {library} (limit: {limit} items, offset: {offset})")
+        logger.info(f"[API /api/scan] Scanning library: {library} (limit: {limit} items, offset: {offset})")
     else:
-        print(f"\n[API /api/scan] Scanning library: {library} (all items)")
+        logger.info(f"[API /api/scan] Scanning library: {library} (all items)")
 
     # Initialize progress
     scan_progress = {
@@ -308,11 +334,11 @@ def scan_library():
         scan_progress["scanning"] = False
 
         # Extract items and total count from result
-        items = result['items']
+        items = [serialize_item(item) for item in result['items']]
         total_count = result['total_count']
         total_artwork = sum(item['total_artwork'] for item in items)
 
-        print(f"[API /api/scan] Scan completed. Items returned: {len(items)}, Total in library: {total_count}, Artwork: {total_artwork}")
+        logger.info(f"[API /api/scan] Scan completed. Items returned: {len(items)}, Total in library: {total_count}, Artwork: {total_artwork}")
 
         # Build response
         response = {
@@ -337,13 +363,13 @@ def scan_library():
                 f"3. The '{library}' library exists and contains media\n"
                 "4. The library items have artwork assigned"
             )
-            print(f"[API /api/scan] WARNING: No items found!")
+            logger.warning(f"[API /api/scan] WARNING: No items found!")
 
         return jsonify(response)
 
     except Exception as e:
         scan_progress["scanning"] = False
-        print(f"[API /api/scan] ERROR: {e}")
+        logger.error(f"[API /api/scan] ERROR: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -363,28 +389,28 @@ def get_thumbnail():
 
     try:
         # Fetch image from Plex
-        print(f"[thumbnail] Fetching: {thumb_url[:150]}...")
+        logger.info(f"[thumbnail] Fetching: {thumb_url[:150]}...")
 
         # Make request with error handling
         # Try to fetch - if it fails (404, redirect loop, etc.), we'll catch it
         try:
             response = requests.get(thumb_url, timeout=10, allow_redirects=True)
         except requests.exceptions.TooManyRedirects:
-            print(f"[thumbnail] Too many redirects for URL (redirect loop)")
+            logger.warning(f"[thumbnail] Too many redirects for URL (redirect loop)")
             return jsonify({"error": "Too many redirects"}), 404
         except requests.exceptions.RequestException as e:
-            print(f"[thumbnail] Request failed: {e}")
+            logger.warning(f"[thumbnail] Request failed: {e}")
             return jsonify({"error": f"Request failed: {str(e)}"}), 404
 
         if response.status_code != 200:
-            print(f"[thumbnail] HTTP {response.status_code} for URL: {thumb_url[:150]}")
-            print(f"[thumbnail] Response text: {response.text[:200]}")
+            logger.warning(f"[thumbnail] HTTP {response.status_code} for URL: {thumb_url[:150]}")
+            logger.warning(f"[thumbnail] Response text: {response.text[:200]}")
             return jsonify({"error": f"Plex returned {response.status_code}"}), 404
 
         # Check if response is actually an image
         content_type = response.headers.get('Content-Type', '')
         if not content_type.startswith('image/'):
-            print(f"[thumbnail] Invalid content type: {content_type}")
+            logger.warning(f"[thumbnail] Invalid content type: {content_type}")
             return jsonify({"error": f"Invalid content type: {content_type}"}), 400
 
         # Open and resize image
@@ -411,19 +437,16 @@ def get_thumbnail():
         return response
 
     except requests.exceptions.Timeout:
-        print(f"[thumbnail] Timeout fetching URL: {thumb_url[:150]}")
+        logger.warning(f"[thumbnail] Timeout fetching URL: {thumb_url[:150]}")
         return jsonify({"error": "Request timeout"}), 504
     except requests.exceptions.RequestException as e:
-        print(f"[thumbnail] Request error for URL: {thumb_url[:150]}")
-        print(f"[thumbnail] Error details: {e}")
-        import traceback
-        traceback.print_exc()
+        # Many thumbnails can fail at once (e.g. Plex offline); tracebacks only at DEBUG
+        logger.error(f"[thumbnail] Request error for URL: {thumb_url[:150]}")
+        logger.error(f"[thumbnail] Error details: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({"error": f"Network error: {str(e)}"}), 500
     except Exception as e:
-        print(f"[thumbnail] ERROR processing URL: {thumb_url[:150]}")
-        print(f"[thumbnail] Error details: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"[thumbnail] ERROR processing URL: {thumb_url[:150]}")
+        logger.error(f"[thumbnail] Error details: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({"error": str(e)}), 500
 
 
@@ -441,9 +464,9 @@ def delete_artwork():
     artwork_paths = data.get('files', [])
     reason = data.get('reason', 'User deletion')
 
-    print(f"\n[API /api/delete] Received delete request")
-    print(f"[API /api/delete] Paths to delete: {len(artwork_paths)}")
-    print(f"[API /api/delete] Reason: {reason}")
+    logger.info(f"[API /api/delete] Received delete request")
+    logger.info(f"[API /api/delete] Paths to delete: {len(artwork_paths)}")
+    logger.info(f"[API /api/delete] Reason: {reason}")
 
     if not artwork_paths:
         return jsonify({"error": "No artwork specified"}), 400
@@ -458,13 +481,13 @@ def delete_artwork():
     failed = 0
 
     for path in artwork_paths:
-        print(f"\n[API /api/delete] Processing: {path}")
+        logger.debug(f"[API /api/delete] Processing: {path}")
 
         # Parse path to extract item rating key
         # Format: "item_rating_key/artwork_type/artwork_rating_key"
         parts = path.split('/')
         if len(parts) != 3:
-            print(f"[API /api/delete] ERROR: Invalid path format: {path}")
+            logger.error(f"[API /api/delete] ERROR: Invalid path format: {path}")
             results.append({
                 "path": path,
                 "success": False,
@@ -480,10 +503,10 @@ def delete_artwork():
 
         if result.get('success'):
             successful += 1
-            print(f"[API /api/delete] ✓ Success: {result.get('message')}")
+            logger.info(f"[API /api/delete] ✓ Success: {result.get('message')}")
         else:
             failed += 1
-            print(f"[API /api/delete] ✗ Failed: {result.get('error')}")
+            logger.warning(f"[API /api/delete] ✗ Failed: {result.get('error')}")
 
         results.append({
             "path": path,
@@ -494,8 +517,8 @@ def delete_artwork():
     total_bytes_freed = sum(r.get('bytes_freed', 0) for r in results if r.get('success'))
     total_mb_freed = round(total_bytes_freed / (1024 * 1024), 2)
 
-    print(f"\n[API /api/delete] Complete: {successful} successful, {failed} failed")
-    print(f"[API /api/delete] Total space freed: {total_mb_freed} MB")
+    logger.info(f"[API /api/delete] Complete: {successful} successful, {failed} failed")
+    logger.info(f"[API /api/delete] Total space freed: {total_mb_freed} MB")
 
     return jsonify({
         "success": failed == 0,
@@ -550,7 +573,7 @@ def clean_old_backups():
 @app.route('/api/empty-trash', methods=['POST'])
 def empty_trash():
     """Permanently delete ALL backups (empty trash)."""
-    print("[API /api/empty-trash] Emptying all backups...")
+    logger.info("[API /api/empty-trash] Emptying all backups...")
 
     try:
         # Delete all backup folders
@@ -576,18 +599,18 @@ def empty_trash():
                     shutil.rmtree(folder)
                     removed_count += 1
                     removed_size += folder_size
-                    print(f"[empty-trash] Removed: {folder.name} ({folder_size} bytes)")
+                    logger.info(f"[empty-trash] Removed: {folder.name} ({folder_size} bytes)")
                 except Exception as e:
-                    print(f"[empty-trash] Failed to remove {folder.name}: {e}")
+                    logger.warning(f"[empty-trash] Failed to remove {folder.name}: {e}")
 
         # Also clear the operations log
         operations_log = backup_dir / "operations.json"
         if operations_log.exists():
             operations_log.unlink()
-            print(f"[empty-trash] Cleared operations log")
+            logger.info(f"[empty-trash] Cleared operations log")
 
         removed_mb = round(removed_size / (1024 * 1024), 2)
-        print(f"[empty-trash] Complete: {removed_count} folders removed, {removed_mb} MB freed")
+        logger.info(f"[empty-trash] Complete: {removed_count} folders removed, {removed_mb} MB freed")
 
         return jsonify({
             "success": True,
@@ -598,7 +621,7 @@ def empty_trash():
         })
 
     except Exception as e:
-        print(f"[empty-trash] ERROR: {e}")
+        logger.error(f"[empty-trash] ERROR: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -630,12 +653,12 @@ def search_items():
 
         return jsonify({
             "success": True,
-            "items": filtered_items,
+            "items": [serialize_item(item) for item in filtered_items],
             "total": len(filtered_items)
         })
 
     except Exception as e:
-        print(f"[API /api/search] ERROR: {e}")
+        logger.error(f"[API /api/search] ERROR: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -681,21 +704,21 @@ def initialize():
     plex_token = config.get('plex_token')
 
     if plex_url and plex_token:
-        print(f"\n[initialize] Initializing Plex API scanner...")
+        logger.info(f"[initialize] Initializing Plex API scanner...")
         scanner = PlexScannerAPI(plex_url, plex_token)
         scanner.connect()
     else:
-        print(f"\n[initialize] No Plex URL/token configured. Scanner not initialized.")
+        logger.info(f"[initialize] No Plex URL/token configured. Scanner not initialized.")
 
 
 if __name__ == '__main__':
     initialize()
-    print("=" * 60)
-    print("Plex Poster Manager API Server (v2.0.0 - Plex API)")
-    print("=" * 60)
-    print(f"Server running on http://localhost:5000")
-    print(f"Plex URL: {config.get('plex_url', 'Not configured')}")
-    print(f"Plex Token: {'Configured' if config.get('plex_token') else 'Not configured'}")
-    print(f"Backup directory: {config.get('backup_directory')}")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Plex Poster Manager API Server (v2.0.0 - Plex API)")
+    logger.info("=" * 60)
+    logger.info(f"Server running on http://localhost:5000")
+    logger.info(f"Plex URL: {config.get('plex_url', 'Not configured')}")
+    logger.info(f"Plex Token: {'Configured' if config.get('plex_token') else 'Not configured'}")
+    logger.info(f"Backup directory: {config.get('backup_directory')}")
+    logger.info("=" * 60)
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -6,6 +6,8 @@ Handles safe deletion, backup, and restoration of artwork files.
 import os
 import shutil
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -21,6 +23,8 @@ class FileManager:
         
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         self.operations_log = self.backup_dir / "operations.json"
+        # delete_file may be called from several threads at once
+        self._lock = threading.Lock()
         self._load_operations()
     
     def _load_operations(self):
@@ -41,9 +45,36 @@ class FileManager:
         Safely delete a file by moving it to backup directory.
         Returns operation info for potential undo.
         """
+        result = self._move_to_backup(file_path, reason)
+        if result["success"]:
+            with self._lock:
+                self._save_operations()
+        return result
+    
+    def delete_files(self, file_paths: List[str], reason: str = "", max_workers: int = 1) -> List[Dict]:
+        """
+        Delete several files like delete_file, writing the operations log once.
+        Moves run on up to max_workers threads; results follow file_paths order.
+        """
+        if max_workers > 1 and len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as pool:
+                results = list(pool.map(lambda path: self._move_to_backup(path, reason), file_paths))
+        else:
+            results = [self._move_to_backup(path, reason) for path in file_paths]
+        
+        if any(result["success"] for result in results):
+            with self._lock:
+                self._save_operations()
+        return results
+    
+    def _move_to_backup(self, file_path: str, reason: str) -> Dict:
+        """Move one file into the backup directory and record it (log not saved yet)."""
         source = Path(file_path)
         
-        if not source.exists():
+        # One stat both checks the file exists and sizes it for the caller
+        try:
+            file_size = source.stat().st_size
+        except OSError:
             return {
                 "success": False,
                 "error": "File does not exist"
@@ -63,23 +94,24 @@ class FileManager:
             shutil.move(str(source), str(destination))
             
             # Log the operation
-            operation = {
-                "id": len(self.operations),
-                "timestamp": timestamp,
-                "action": "delete",
-                "original_path": str(source),
-                "backup_path": str(destination),
-                "reason": reason,
-                "can_undo": True
-            }
-            
-            self.operations.append(operation)
-            self._save_operations()
+            with self._lock:
+                operation = {
+                    "id": len(self.operations),
+                    "timestamp": timestamp,
+                    "action": "delete",
+                    "original_path": str(source),
+                    "backup_path": str(destination),
+                    "reason": reason,
+                    "can_undo": True
+                }
+                
+                self.operations.append(operation)
             
             return {
                 "success": True,
                 "operation_id": operation["id"],
-                "backup_path": str(destination)
+                "backup_path": str(destination),
+                "bytes_freed": file_size
             }
         
         except Exception as e:
@@ -92,14 +124,10 @@ class FileManager:
         """Delete multiple files in a batch operation."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         batch_id = len(self.operations)
-        results = []
-        
-        for file_path in file_paths:
-            result = self.delete_file(file_path, reason)
-            results.append({
-                "file": file_path,
-                **result
-            })
+        results = [
+            {"file": file_path, **result}
+            for file_path, result in zip(file_paths, self.delete_files(file_paths, reason))
+        ]
         
         return {
             "batch_id": batch_id,
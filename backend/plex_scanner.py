@@ -11,11 +11,60 @@ HYBRID APPROACH (Best Solution - Thanks to Gemini & Grok LLMs!):
 - Works 100% offline, no Plex token required
 """
 
+import asyncio
 import os
+import queue
+import sqlite3
+import threading
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import hashlib
+from functools import lru_cache
+from itertools import islice
+
+# Prefix of Plex agent folders and filenames (e.g., com.plexapp.agents.thetvdb)
+AGENT_PREFIX = "com.plexapp.agents."
+
+# Info.xml locations inside a bundle, agent-specific first (most reliable):
+# Contents/<agent>/Info.xml, then Contents/Info.xml, Info.xml, Contents/_combined/Info.xml
+INFO_XML_CANDIDATES = tuple(
+    os.path.join(*parts) for parts in (
+        ("Contents", AGENT_PREFIX + "thetvdb", "Info.xml"),
+        ("Contents", AGENT_PREFIX + "themoviedb", "Info.xml"),
+        ("Contents", AGENT_PREFIX + "imdb", "Info.xml"),
+        ("Contents", AGENT_PREFIX + "localmedia", "Info.xml"),
+        ("Contents", "Info.xml"),
+        ("Info.xml",),
+        ("Contents", "_combined", "Info.xml"),
+    )
+)
+
+# Artwork folder names (lowercase in modern Plex) and the image files we list
+ARTWORK_FOLDERS = ("posters", "art", "backgrounds", "banners", "themes")
+IMAGE_EXTENSIONS = frozenset((".jpg", ".jpeg", ".png", ".gif"))
+
+# Persistent (path, size, mtime) -> hash cache so unchanged artwork is not re-hashed every scan
+HASH_CACHE_PATH = Path.home() / ".plex-poster-manager" / "hash_cache.sqlite"
+
+# How many bundles the readahead thread may list ahead of the scan loop
+PREFETCH_DEPTH = 32
+# How often a readahead thread blocked on a full queue checks whether the scan stopped
+PREFETCH_PUT_TIMEOUT = 0.5
+
+# Bundles scanned concurrently, and bundles handed to the event loop per batch
+SCAN_CONCURRENCY = 32
+SCAN_BATCH_SIZE = 64
+
+# Title lookup by bundle hash, and metadata_type -> name (index 0 unused)
+TITLE_BY_HASH_SQL = (
+    "SELECT title, metadata_type, year, studio, summary, guid, id "
+    "FROM metadata_items WHERE hash = ? LIMIT 1"
+)
+METADATA_TYPES = ("unknown", "movie", "show", "season", "episode")
+
+# Read size for file hashing (the old 4 KB chunks meant one Python call per 4 KB)
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 class PlexScanner:
@@ -23,6 +72,16 @@ class PlexScanner:
         self.metadata_path = Path(metadata_path)
         self.cache = {}
 
+        # Plex library database (<Plex Media Server>/Plug-in Support/Databases/...)
+        self.db_path = (self.metadata_path.parent / "Plug-in Support" / "Databases"
+                        / "com.plexapp.plugins.library.db")
+        self._db_conn = None
+
+        # Hash cache: loaded once, new entries are flushed in one batch after a scan
+        self._hash_cache_path = HASH_CACHE_PATH
+        self._hash_cache = None
+        self._pending_hashes = []
+
         print(f"[PlexScanner] Initialized with path: {self.metadata_path}")
         print(f"[PlexScanner] Path exists: {self.metadata_path.exists()}")
         print(f"[PlexScanner] Path is directory: {self.metadata_path.is_dir() if self.metadata_path.exists() else 'N/A'}")
@@ -218,26 +277,20 @@ class PlexScanner:
             }
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
+            # One read-only connection per scanner; sqlite3 caches the compiled
+            # statement by SQL text, so repeated lookups skip parsing
+            if self._db_conn is None:
+                self._db_conn = sqlite3.connect(
+                    f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+                )
 
-            # Query metadata_items table by hash
-            cursor.execute("""
-                SELECT title, metadata_type, year, studio, summary, guid, id
-                FROM metadata_items
-                WHERE hash = ?
-                LIMIT 1
-            """, (bundle_hash,))
-
-            result = cursor.fetchone()
-            conn.close()
+            result = self._db_conn.execute(TITLE_BY_HASH_SQL, (bundle_hash,)).fetchone()
 
             if result:
                 title, meta_type, year, studio, summary, guid, item_id = result
 
                 # Map metadata_type to string
-                type_map = {1: "movie", 2: "show", 3: "season", 4: "episode"}
-                type_str = type_map.get(meta_type, "unknown")
+                type_str = METADATA_TYPES[meta_type] if meta_type in range(1, len(METADATA_TYPES)) else "unknown"
 
                 return {
                     "title": title or f"Bundle {bundle_hash[:12]}",
@@ -295,7 +348,7 @@ class PlexScanner:
             for root, dirs, files in os.walk(library_path):
                 for d in dirs:
                     if d.endswith(".bundle"):
-                        bundle_path = Path(root) / d
+                        bundle_path = Path(os.path.join(root, d))
                         bundles.append(bundle_path)
                         print(f"[find_bundles] Found bundle: {bundle_path.name}")
         except Exception as e:
@@ -313,25 +366,13 @@ class PlexScanner:
         - Contents/com.plexapp.agents.imdb/Info.xml
         - Contents/Info.xml (fallback)
         """
-        # Try agent-specific locations first (most reliable)
-        agent_candidates = [
-            bundle_path / "Contents" / "com.plexapp.agents.thetvdb" / "Info.xml",
-            bundle_path / "Contents" / "com.plexapp.agents.themoviedb" / "Info.xml",
-            bundle_path / "Contents" / "com.plexapp.agents.imdb" / "Info.xml",
-            bundle_path / "Contents" / "com.plexapp.agents.localmedia" / "Info.xml"
-        ]
+        # Plain string paths: this runs for every bundle, and Path arithmetic
+        # allocates a new object per "/" (see INFO_XML_CANDIDATES)
+        prefix = str(bundle_path) + os.sep
 
-        # Fallback locations
-        fallback_candidates = [
-            bundle_path / "Contents" / "Info.xml",
-            bundle_path / "Info.xml",
-            bundle_path / "Contents" / "_combined" / "Info.xml"
-        ]
-
-        candidates = agent_candidates + fallback_candidates
-
-        for info_path in candidates:
-            if info_path.exists():
+        for relative_path in INFO_XML_CANDIDATES:
+            info_path = prefix + relative_path
+            if os.path.exists(info_path):
                 try:
                     # Parse the XML
                     tree = ET.parse(info_path)
@@ -405,94 +446,249 @@ class PlexScanner:
             "themes": []
         }
 
-        # Modern Plex locations to check
+        # Plain string paths and os.scandir keep this per-file loop free of
+        # Path objects; scandir also returns file types without extra stats
+        sep = os.sep
+        bundle_str = str(bundle_path)
+        contents_path = bundle_str + sep + "Contents"
+
+        # Modern Plex locations to check: (path, location name, source)
         search_bases = [
-            bundle_path / "Contents" / "_combined",  # Selected artwork (priority)
-            bundle_path / "Uploads"  # User uploads
+            (contents_path + sep + "_combined", "_combined", "selected"),  # Selected artwork (priority)
+            (bundle_str + sep + "Uploads", "Uploads", "uploaded")  # User uploads
         ]
 
         # Also scan agent-specific folders (com.plexapp.agents.*)
-        contents_path = bundle_path / "Contents"
-        if contents_path.exists():
-            try:
-                for agent_dir in contents_path.iterdir():
-                    if agent_dir.is_dir() and agent_dir.name.startswith("com.plexapp.agents."):
-                        search_bases.append(agent_dir)
-            except Exception:
-                pass  # Skip if can't read Contents/
-
-        # Map folder names to artwork types (lowercase for modern Plex)
-        folder_mapping = {
-            "posters": "posters",
-            "art": "art",
-            "backgrounds": "backgrounds",
-            "banners": "banners",
-            "themes": "themes"
-        }
-
-        # Scan all locations
-        for base_path in search_bases:
-            if not base_path.exists():
+        try:
+            with os.scandir(contents_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith(AGENT_PREFIX) and entry.is_dir():
+                        # Source is the agent name (e.g., thetvdb, themoviedb)
+                        search_bases.append((entry.path, entry.name, entry.name[len(AGENT_PREFIX):]))
+        except OSError:
+            pass  # Skip if can't read Contents/
+
+        # Scan all locations (folder names match artwork types in modern Plex)
+        for base_path, location, source in search_bases:
+            if not os.path.isdir(base_path):
                 continue
 
-            for folder_name, artwork_type in folder_mapping.items():
-                folder_path = base_path / folder_name
-                if folder_path.exists() and folder_path.is_dir():
-                    try:
-                        for file_path in folder_path.iterdir():
-                            if file_path.is_file() and file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif']:
-                                # Determine source from path
-                                if "_combined" in str(base_path):
-                                    source = "selected"
-                                elif "Uploads" in str(base_path):
-                                    source = "uploaded"
-                                elif "com.plexapp.agents." in str(base_path):
-                                    # Extract agent name (e.g., thetvdb, themoviedb)
-                                    agent = base_path.name.replace("com.plexapp.agents.", "")
-                                    source = agent
-                                else:
-                                    source = "unknown"
+            for artwork_type in ARTWORK_FOLDERS:
+                folder_path = base_path + sep + artwork_type
+                if not os.path.isdir(folder_path):
+                    continue
 
+                try:
+                    with os.scandir(folder_path) as entries:
+                        for entry in entries:
+                            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
                                 # Get file info
-                                file_stat = file_path.stat()
+                                file_stat = entry.stat()
 
                                 artwork[artwork_type].append({
-                                    "path": str(file_path),
-                                    "filename": file_path.name,
+                                    "path": entry.path,
+                                    "filename": entry.name,
                                     "source": source,
-                                    "location": base_path.name,  # _combined, Uploads, or agent name
+                                    "location": location,  # _combined, Uploads, or agent name
                                     "size": file_stat.st_size,
                                     "modified": file_stat.st_mtime,
-                                    "hash": self._get_file_hash(file_path)
+                                    "hash": ""  # Filled in by find_duplicates only when needed
                                 })
-                    except Exception:
-                        # Skip folders we can't read
-                        continue
+                except OSError:
+                    # Skip folders we can't read
+                    continue
 
         return artwork
     
-    def _extract_source_from_filename(self, filename: str) -> str:
+    def _prefetch_bundles(self, bundles: List[Path], depth: int = PREFETCH_DEPTH):
+        """Yield bundles while a background thread lists the upcoming ones.
+
+        Listing a bundle's directories ahead of time warms the OS directory
+        cache, so on slow (network) storage the scan loop no longer waits on
+        directory enumeration before it can read artwork.
+        """
+        prefetched = queue.Queue(maxsize=depth)
+        done = object()
+        # Set once the consumer stops (finished, failed or abandoned the generator)
+        stop = threading.Event()
+
+        def put(value) -> bool:
+            while not stop.is_set():
+                try:
+                    prefetched.put(value, timeout=PREFETCH_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def readahead():
+            for bundle_path in bundles:
+                if stop.is_set():
+                    return
+                for sub in ("", "Contents", "Uploads"):
+                    try:
+                        os.listdir(os.path.join(bundle_path, sub))
+                    except OSError:
+                        pass
+                if not put(bundle_path):
+                    return
+            put(done)
+
+        threading.Thread(target=readahead, name="readahead", daemon=True).start()
+
+        try:
+            while True:
+                bundle_path = prefetched.get()
+                if bundle_path is done:
+                    return
+                yield bundle_path
+        finally:
+            stop.set()
+
+    def _scan_bundle(self, bundle_path: Path) -> Tuple[Dict[str, List[Dict]], int, Optional[Dict]]:
+        """Read one bundle's artwork and, if it has any, its Info.xml title."""
+        artwork = self.get_artwork_files(bundle_path)
+        total_artwork = sum(len(v) for v in artwork.values())
+        xml_info = self.parse_info_xml(bundle_path) if total_artwork > 0 else None
+        return artwork, total_artwork, xml_info
+
+    async def _scan_async(self, bundles: List[Path], on_bundle):
+        """Scan bundles on worker threads, SCAN_CONCURRENCY at a time.
+
+        Bundles are taken in batches of SCAN_BATCH_SIZE and on_bundle is
+        called for each one in order once its batch completes.
+        """
+        semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+        async def scan_one(bundle_path):
+            async with semaphore:
+                return await asyncio.to_thread(self._scan_bundle, bundle_path)
+
+        prefetched = self._prefetch_bundles(bundles)
+        idx = 0
+        try:
+            while True:
+                batch = list(islice(prefetched, SCAN_BATCH_SIZE))
+                if not batch:
+                    break
+
+                scanned = await asyncio.gather(*(scan_one(bundle_path) for bundle_path in batch))
+                for bundle_path, (artwork, total_artwork, xml_info) in zip(batch, scanned):
+                    on_bundle(idx, bundle_path, artwork, total_artwork, xml_info)
+                    idx += 1
+        finally:
+            # Stops the readahead thread if on_bundle (e.g. a progress callback) raised
+            prefetched.close()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_source_from_filename(filename: str) -> str:
         """Extract the source agent from a filename."""
         # Example: com.plexapp.agents.thetvdb_abc123.jpg -> thetvdb
-        if "com.plexapp.agents." in filename:
-            parts = filename.split("com.plexapp.agents.")[1]
-            source = parts.split("_")[0].split(".")[0]
-            return source
+        if filename.startswith(AGENT_PREFIX):
+            rest = filename[len(AGENT_PREFIX):]
+        elif AGENT_PREFIX in filename:
+            rest = filename.split(AGENT_PREFIX, 1)[1]
         elif "local" in filename.lower():
             return "local"
         else:
             return "unknown"
+
+        # Agent name ends at the first "_" or "."
+        end = len(rest)
+        for sep in ("_", "."):
+            pos = rest.find(sep, 0, end)
+            if pos >= 0:
+                end = pos
+        return rest[:end]
     
-    def _get_file_hash(self, file_path: Path) -> str:
-        """Get MD5 hash of a file for duplicate detection."""
+    def _load_hash_cache(self) -> Dict[str, Tuple[int, float, bytes]]:
+        """Load the persistent hash cache into memory (once per scanner)."""
+        if self._hash_cache is not None:
+            return self._hash_cache
+
+        self._hash_cache = {}
+        try:
+            self._hash_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._hash_cache_path))
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS file_hashes "
+                    "(path TEXT PRIMARY KEY, size INT, mtime REAL, hash BLOB)"
+                )
+                for path, size, mtime, file_hash in conn.execute(
+                    "SELECT path, size, mtime, hash FROM file_hashes"
+                ):
+                    if isinstance(file_hash, str):
+                        # Rows written before digests were stored raw
+                        file_hash = bytes.fromhex(file_hash)
+                    self._hash_cache[path] = (size, mtime, file_hash)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"[hash_cache] Could not load hash cache: {e}")
+
+        return self._hash_cache
+
+    def _flush_hash_cache(self):
+        """Write all newly computed hashes to the cache in a single transaction."""
+        if not self._pending_hashes:
+            return
+
+        pending, self._pending_hashes = self._pending_hashes, []
+        try:
+            conn = sqlite3.connect(str(self._hash_cache_path))
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO file_hashes (path, size, mtime, hash) VALUES (?, ?, ?, ?)",
+                        pending
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[hash_cache] Could not save hash cache: {e}")
+
+    def _get_file_hash(self, file_path: Path, size: int = None, mtime: float = None) -> bytes:
+        """Get the raw 16-byte MD5 digest of a file for duplicate detection.
+
+        Served from the hash cache when the file's size and mtime are unchanged.
+        Returns b"" if the file cannot be read; call .hex() for display.
+        """
+        path = str(file_path)
+        if size is None or mtime is None:
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                return b""
+            size, mtime = file_stat.st_size, file_stat.st_mtime
+
+        cached = self._load_hash_cache().get(path)
+        if cached and cached[0] == size and cached[1] == mtime:
+            return cached[2]
+
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            # Unbuffered: reads go straight into the hash buffer, no extra copy
+            with open(file_path, "rb", buffering=0) as f:
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: the read/update loop runs in C
+                    hash_md5 = hashlib.file_digest(f, "md5")
+                else:
+                    hash_md5 = hashlib.md5()
+                    buf = bytearray(HASH_CHUNK_SIZE)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        hash_md5.update(view[:n])
+            file_hash = hash_md5.digest()
         except Exception:
-            return ""
+            return b""
+
+        self._hash_cache[path] = (size, mtime, file_hash)
+        self._pending_hashes.append((path, size, mtime, file_hash))
+        return file_hash
     
     def scan_library(self, library: str = "TV Shows", progress_callback=None) -> List[Dict]:
         """Scan an entire library and return all items with their artwork.
@@ -513,7 +709,9 @@ class PlexScanner:
         xml_title_count = 0
         hash_title_count = 0
 
-        for idx, bundle_path in enumerate(bundles):
+        def handle_bundle(idx, bundle_path, artwork, total_artwork, xml_info):
+            nonlocal bundles_without_artwork, xml_title_count, hash_title_count
+
             if progress_callback:
                 progress_callback(idx + 1, total)
 
@@ -521,17 +719,10 @@ class PlexScanner:
             if idx % 100 == 0 or idx < 5:
                 print(f"\n[scan_library] Processing bundle {idx+1}/{total}: {bundle_path.name}")
 
-            # Get artwork from filesystem
-            artwork = self.get_artwork_files(bundle_path)
-            total_artwork = sum(len(v) for v in artwork.values())
-
             if total_artwork > 0:
                 # Extract bundle hash for fallback
                 bundle_hash = bundle_path.name.replace('.bundle', '')
 
-                # Try to get title from Info.xml in bundle
-                xml_info = self.parse_info_xml(bundle_path)
-
                 if xml_info:
                     # Use real title from XML!
                     info = xml_info
@@ -565,6 +756,9 @@ class PlexScanner:
             else:
                 bundles_without_artwork += 1
 
+        # Bundles are read concurrently, but handled in their original order
+        asyncio.run(self._scan_async(bundles, handle_bundle))
+
         print(f"\n[scan_library] Scan complete!")
         print(f"[scan_library] Results summary:")
         print(f"  - Total bundles scanned: {total}")
@@ -576,21 +770,44 @@ class PlexScanner:
         return results
     
     def find_duplicates(self, items: List[Dict]) -> List[Tuple[Dict, Dict]]:
-        """Find duplicate artwork across items based on file hash."""
+        """Find duplicate artwork across items based on file hash.
+
+        Files can only be identical if their sizes match, so only files that
+        share a size with another file are hashed.
+        """
+        all_files = [
+            file_info
+            for item in items
+            for files in item["artwork"].values()
+            for file_info in files
+        ]
+
+        size_counts = {}
+        for file_info in all_files:
+            size_counts[file_info["size"]] = size_counts.get(file_info["size"], 0) + 1
+
         hash_map = {}
         duplicates = []
-        
-        for item in items:
-            for artwork_type, files in item["artwork"].items():
-                for file_info in files:
-                    file_hash = file_info["hash"]
-                    if file_hash and file_hash in hash_map:
-                        duplicates.append((hash_map[file_hash], file_info))
-                    else:
-                        hash_map[file_hash] = file_info
-        
-        return duplicates
 
+        for file_info in all_files:
+            if size_counts[file_info["size"]] < 2:
+                continue
+
+            # Key on the raw digest; the hex form is only for the returned dicts
+            file_hash = self._get_file_hash(
+                Path(file_info["path"]), file_info["size"], file_info["modified"]
+            )
+            if not file_info["hash"]:
+                file_info["hash"] = file_hash.hex()
+
+            if file_hash and file_hash in hash_map:
+                duplicates.append((hash_map[file_hash], file_info))
+            else:
+                hash_map[file_hash] = file_info
+
+        self._flush_hash_cache()
+
+        return duplicates
 
 def detect_plex_path() -> Optional[str]:
     """Auto-detect Plex metadata path based on OS."""
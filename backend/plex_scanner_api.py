@@ -6,6 +6,7 @@ Based on how Kometa and Tautulli handle Plex artwork.
 
 import sys
 import io
+import logging
 
 # Fix Windows console encoding for Unicode characters (emojis in library names, etc.)
 if sys.platform == 'win32':
@@ -16,14 +17,244 @@ if sys.platform == 'win32':
         pass  # Fallback to default encoding if wrapper fails
 
 from plexapi.server import PlexServer
-from plexapi.exceptions import BadRequest, NotFound, Unauthorized
+from plexapi.exceptions import NotFound, Unauthorized
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, NamedTuple
+from collections import OrderedDict
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import threading
 import os
 import platform
+import json
+import re
+import sqlite3
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# True on free-threaded builds (PEP 703, e.g. python3.13t) with the GIL actually disabled
+_FREE_THREADED = hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled()
+
+# Seconds to wait on a Plex response before giving up (plexapi defaults to 30)
+PLEX_TIMEOUT = 30
+
+# Default number of items in flight during a scan (override with PLEX_SCAN_WORKERS
+# or the concurrency argument). The scan waits on Plex HTTP responses, not CPU, and
+# a Plex server comfortably serves 30-50 concurrent requests.
+SCAN_WORKERS = 32
+try:
+    SCAN_WORKERS = max(1, int(os.environ.get('PLEX_SCAN_WORKERS', SCAN_WORKERS)))
+except ValueError:
+    logger.warning(f"[PlexScannerAPI] Ignoring invalid PLEX_SCAN_WORKERS="
+                   f"{os.environ['PLEX_SCAN_WORKERS']!r}, using {SCAN_WORKERS}")
+
+
+def _create_session(concurrency: int = SCAN_WORKERS, retries: bool = True) -> requests.Session:
+    """
+    Create a requests session with a keep-alive connection pool.
+
+    All Plex traffic goes through one pool so the scan worker threads reuse
+    TCP connections instead of opening a new one for every API call.
+
+    Args:
+        concurrency: Number of scan workers the pool has to serve
+        retries: Retry connection errors and 5xx responses (off for quick probes)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        # Every scan worker can have all of its artwork fetches in flight at once
+        pool_maxsize=concurrency * len(_ARTWORK_SOURCES),
+        # The only retry layer for Plex requests: connection errors and 5xx responses.
+        # Read timeouts and 4xx (bad token, deleted item) fail at once; raise_on_status=False
+        # hands the final 5xx response to plexapi so it still raises its own BadRequest
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=3,
+            backoff_factor=0.25,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        ) if retries else Retry(0, read=False)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = 'PlexPosterManager/2.0'
+    return session
+
+
+# progress_callback is invoked at most every PROGRESS_INTERVAL seconds or
+# PROGRESS_BATCH completions (and always for the last item)
+PROGRESS_INTERVAL = 0.1
+PROGRESS_BATCH = 50
+
+# How long a scan's Uploads listing is reused by delete_artwork
+UPLOADS_CACHE_TTL = 60
+
+# Artwork files moved to the backup folder in parallel by delete_artwork
+DELETE_WORKERS = 8
+
+_BYTES_PER_MB = 1 << 20
+
+# Seconds delete_artwork waits for more deletions on the same item before one Plex refresh
+REFRESH_DEBOUNCE = 0.5
+# Background refresh requests sent to Plex at once (a batch delete can queue hundreds)
+REFRESH_WORKERS = 2
+
+# How long get_libraries() results are reused before asking Plex again
+LIBRARIES_CACHE_TTL = 60
+
+# Items fetched by rating key for delete_artwork/refresh_metadata: reuse window and cap
+ITEM_CACHE_TTL = 60
+ITEM_CACHE_SIZE = 256
+
+# Persistent artwork listing cache, keyed by ratingKey and validated by updatedAt
+ARTWORK_CACHE_PATH = Path.home() / ".plex-poster-manager" / "artwork_cache.sqlite"
+ARTWORK_CACHE_TTL = 7 * 24 * 3600
+# Stands in for the Plex token in cached thumb URLs, so the token is never written to disk
+_TOKEN_PLACEHOLDER = "{plex_token}"
+
+# Artwork lists fetched per item:
+# (artwork_data key, plexapi method, path/key prefix, frontend type, log label)
+_ARTWORK_SOURCES = (
+    ("posters", "posters", "poster", "poster", "posters"),
+    ("art", "arts", "art", "background", "background arts"),
+    ("banners", "banners", "banner", "banner", "banners"),
+    ("themes", "themes", "theme", "theme", "themes"),
+)
+
+# Default Plex data directory for this platform, used when the server can't tell us
+_SYSTEM = platform.system()
+if _SYSTEM == 'Windows':
+    _DEFAULT_PLEX_DATA_DIR = Path(os.environ.get('LOCALAPPDATA', '')) / "Plex Media Server"
+elif _SYSTEM == 'Darwin':  # macOS
+    _DEFAULT_PLEX_DATA_DIR = Path.home() / "Library" / "Application Support" / "Plex Media Server"
+else:  # Linux
+    _DEFAULT_PLEX_DATA_DIR = Path("/var/lib/plexmediaserver/Library/Application Support/Plex Media Server")
+
+# Artwork subfolders Plex creates under an item's Uploads folder
+UPLOAD_SUBFOLDERS = ('posters', 'art', 'backgrounds', 'banners', 'themes')
+
+# Thumb path handling in _build_thumb_url
+_META_RE = re.compile(r'/library/metadata/(\d+)/')
+_EXTERNAL_URL_PREFIXES = ('http://', 'https://')
+_INTERNAL_REF_RE = re.compile(r'/file\?url=|metadata://|upload://')
+
+
+class ArtworkEntry(NamedTuple):
+    """One artwork option for an item (compact stand-in for a 6-key dict)."""
+    path: str
+    provider: str
+    selected: bool
+    thumb_url: str
+    rating_key: str
+    type: str
+
+
+def serialize_item(item_data: Dict) -> Dict:
+    """
+    Convert a scanned item's ArtworkEntry tuples to plain dicts for JSON.
+
+    json/jsonify would otherwise encode each NamedTuple as a bare list.
+    """
+    return {
+        **item_data,
+        "artwork": {
+            key: [entry._asdict() for entry in entries]
+            for key, entries in item_data["artwork"].items()
+        }
+    }
+
+
+def _deserialize_item(data: Dict) -> Dict:
+    """Inverse of serialize_item(), used when reading the artwork cache."""
+    data["artwork"] = {
+        key: [ArtworkEntry(**entry) for entry in entries]
+        for key, entries in data["artwork"].items()
+    }
+    return data
+
+
+def _read_dir(path: str, dir_mtimes: Optional[Dict[str, int]]) -> List[os.DirEntry]:
+    """scandir a directory, recording its mtime first when dir_mtimes is given."""
+    if dir_mtimes is not None:
+        # Taken before listing, so a change made mid-listing still invalidates the index
+        dir_mtimes[path] = os.stat(path).st_mtime_ns
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def _list_upload_files(uploads_dir: str, dir_mtimes: Optional[Dict[str, int]] = None) -> List[str]:
+    """
+    List the deletable artwork files in an item's Uploads folder.
+
+    Structure: Uploads/posters/*, Uploads/art/*, ..., Uploads/posters/seasons/<n>/*,
+    plus files directly in Uploads. Plex stores files WITHOUT extensions, so every
+    file counts. Each directory is read with a single os.scandir call.
+
+    Args:
+        uploads_dir: Path to the item's Uploads folder
+        dir_mtimes: Optional dict filled with {directory: st_mtime_ns} for every
+            directory read, so the listing can be revalidated later with stats only
+
+    Raises:
+        OSError: if uploads_dir does not exist or cannot be read
+    """
+    root_entries = _read_dir(uploads_dir, dir_mtimes)
+
+    subdirs = {entry.name: entry.path for entry in root_entries if entry.is_dir()}
+    files = []
+
+    for subfolder in UPLOAD_SUBFOLDERS:
+        subfolder_path = subdirs.get(subfolder)
+        if subfolder_path is None:
+            continue
+        try:
+            entries = _read_dir(subfolder_path, dir_mtimes)
+        except OSError:
+            continue
+        files.extend(entry.path for entry in entries if entry.is_file())
+
+        # Also check season subfolders (e.g., posters/seasons/1/)
+        if subfolder == 'posters':
+            seasons_dir = next((e.path for e in entries if e.name == 'seasons' and e.is_dir()), None)
+            if seasons_dir is None:
+                continue
+            try:
+                season_dirs = [entry.path for entry in _read_dir(seasons_dir, dir_mtimes) if entry.is_dir()]
+                for season_dir in season_dirs:
+                    files.extend(entry.path for entry in _read_dir(season_dir, dir_mtimes) if entry.is_file())
+            except OSError:
+                continue
+
+    # Also check root Uploads folder (some setups might put files there directly)
+    files.extend(entry.path for entry in root_entries if entry.is_file())
+    return files
+
+
+# App config (read for the backup directory used by delete_artwork)
+CONFIG_PATH = Path(__file__).parent.parent / "config.json"
+
+# Shared session for detect_plex_url() probes; a refused or unreachable address fails
+# at once, the next candidate is tried instead of retrying this one
+_detect_session = _create_session(concurrency=1, retries=False)
+
+# How long a detected Plex URL is returned without probing again
+DETECT_CACHE_TTL = 300
+_detected_url = None  # (found_at, url); the url is also tried first once it expires
+
+# Local addresses detect_plex_url() probes: (server URL, identity endpoint)
+_COMMON_PLEX_URLS = tuple(
+    (url, f"{url}/identity")
+    for url in ("http://localhost:32400", "http://127.0.0.1:32400", "http://0.0.0.0:32400")
+)
 
 
 class PlexScannerAPI:
@@ -43,21 +274,57 @@ class PlexScannerAPI:
     - Future-proof (Plex API is stable)
     """
 
-    def __init__(self, plex_url: str, plex_token: str):
+    def __init__(self, plex_url: str, plex_token: str, concurrency: int = None):
         """
         Initialize Plex API scanner.
 
         Args:
             plex_url: Plex server URL (e.g., 'http://localhost:32400')
             plex_token: Plex authentication token (REQUIRED)
+            concurrency: Items scanned in parallel (default SCAN_WORKERS)
         """
         self.plex_url = plex_url.rstrip('/')
         self.plex_token = plex_token
         self.plex = None
+        self.concurrency = max(1, concurrency or SCAN_WORKERS)
+        self._session = _create_session(self.concurrency)
+        self._token_qs = f"?X-Plex-Token={plex_token}"
+        # Per-instance memo so URLs carrying this token never outlive the scanner
+        self._thumb_url_cache = lru_cache(maxsize=65536)(self._make_thumb_url)
+
+        # Artwork cache scope: thumb URLs embed the server URL and token
+        self._cache_scope = hashlib.sha1(f"{self.plex_url}|{plex_token}".encode()).hexdigest()[:16]
+        self._artwork_cache = None
+        self._pending_cache = []
+        self._libraries_cache = None  # (fetched_at, libraries)
+        self._sections_cache = None  # (fetched_at, sections)
+        self._connect_lock = threading.Lock()
+        self._plex_data_dir = None
+        self._plex_data_dir_lock = threading.Lock()
+        self._uploads_cache = {}  # rating_key -> (listed_at, files)
+        self._file_manager = None
+        self._config_mtime = None
+        self._uploads_index = None  # uploads_dir -> (dir_mtimes, files), see _load_uploads_index
+        self._pending_uploads_index = []
+        self._uploads_lock = threading.Lock()
+        self._item_cache = OrderedDict()  # rating_key -> (fetched_at, item), see _get_item
+        self._item_cache_lock = threading.Lock()
+        self._pending_refresh = {}  # rating_key -> threading.Timer, see _schedule_refresh
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=REFRESH_WORKERS,
+            thread_name_prefix='plex-refresh'
+        )
+        # Runs one item's posters/arts/banners/themes requests side by side; kept separate
+        # from the per-item scan pool so scan workers never wait on their own pool
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=self.concurrency * len(_ARTWORK_SOURCES),
+            thread_name_prefix='plex-fetch'
+        )
 
-        print(f"\n[PlexScannerAPI] Initializing with Plex API")
-        print(f"[PlexScannerAPI] URL: {plex_url}")
-        print(f"[PlexScannerAPI] Token: {plex_token[:10]}..." if plex_token else "[PlexScannerAPI] Token: None")
+        logger.info(f"[PlexScannerAPI] Initializing with Plex API")
+        logger.info(f"[PlexScannerAPI] URL: {plex_url}")
+        logger.info(f"[PlexScannerAPI] Token: {plex_token[:10]}..." if plex_token else "[PlexScannerAPI] Token: None")
 
     def connect(self) -> bool:
         """
@@ -67,52 +334,88 @@ class PlexScannerAPI:
             True if connection successful, False otherwise
         """
         try:
-            print(f"\n[PlexScannerAPI] Connecting to Plex server...")
-            self.plex = PlexServer(self.plex_url, self.plex_token)
+            logger.info(f"[PlexScannerAPI] Connecting to Plex server...")
+            self._sections_cache = None
+            self.plex = PlexServer(self.plex_url, self.plex_token, session=self._session, timeout=PLEX_TIMEOUT)
 
             # Verify connection by getting server identity
-            print(f"[PlexScannerAPI] Connected to: {self.plex.friendlyName}")
-            print(f"[PlexScannerAPI] Version: {self.plex.version}")
-            print(f"[PlexScannerAPI] Platform: {self.plex.platform}")
+            logger.info(f"[PlexScannerAPI] Connected to: {self.plex.friendlyName}")
+            logger.info(f"[PlexScannerAPI] Version: {self.plex.version}")
+            logger.info(f"[PlexScannerAPI] Platform: {self.plex.platform}")
             return True
 
         except Unauthorized:
-            print(f"[PlexScannerAPI] ERROR: Invalid Plex token")
+            logger.error(f"[PlexScannerAPI] ERROR: Invalid Plex token")
             return False
         except Exception as e:
-            print(f"[PlexScannerAPI] ERROR: Connection failed - {e}")
+            logger.error(f"[PlexScannerAPI] ERROR: Connection failed - {e}")
             return False
 
+    def _ensure_connected(self) -> bool:
+        """Connect on first use; concurrent first callers share a single connect()."""
+        if self.plex:
+            return True
+        with self._connect_lock:
+            if self.plex:
+                return True
+            return self.connect()
+
+    def _get_sections(self) -> List:
+        """
+        Get the server's library sections, reused for LIBRARIES_CACHE_TTL seconds.
+
+        Section objects memoize totalSize/updatedAt, so they are refreshed on
+        the same schedule as get_libraries() rather than kept forever.
+        """
+        cached = self._sections_cache
+        if cached and time.monotonic() - cached[0] < LIBRARIES_CACHE_TTL:
+            return cached[1]
+
+        sections = self.plex.library.sections()
+        self._sections_cache = (time.monotonic(), sections)
+        return sections
+
     def get_libraries(self) -> List[Dict]:
         """
         Get list of available libraries with item counts.
 
+        Results are reused for LIBRARIES_CACHE_TTL seconds.
+
         Returns:
             List of dicts with 'name' and 'count' keys
         """
-        if not self.plex:
-            if not self.connect():
-                return []
+        cached = self._libraries_cache
+        if cached and time.monotonic() - cached[0] < LIBRARIES_CACHE_TTL:
+            return [dict(library) for library in cached[1]]
+
+        if not self._ensure_connected():
+            return []
 
         try:
+            sections = self._get_sections()
+
+            # Use totalSize property instead of loading all items
+            # This is MUCH faster (instant vs 30 seconds); each is one request, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix='plex-libraries') as executor:
+                counts = list(executor.map(lambda section: section.totalSize, sections))
+
             libraries = []
-            for section in self.plex.library.sections():
-                # Use totalSize property instead of loading all items
-                # This is MUCH faster (instant vs 30 seconds)
-                item_count = section.totalSize
+            for section, item_count in zip(sections, counts):
                 libraries.append({
                     'name': section.title,
                     'count': item_count
                 })
-                print(f"[get_libraries] {section.title}: {item_count} items")
+                logger.info(f"[get_libraries] {section.title}: {item_count} items")
 
-            print(f"\n[get_libraries] Found {len(libraries)} libraries")
-            return libraries
+            logger.info(f"[get_libraries] Found {len(libraries)} libraries")
+            self._libraries_cache = (time.monotonic(), libraries)
+            return [dict(library) for library in libraries]
         except Exception as e:
-            print(f"[get_libraries] ERROR: {e}")
+            logger.error(f"[get_libraries] ERROR: {e}")
             return []
 
-    def scan_library(self, library_name: str, progress_callback=None, limit: int = None, offset: int = 0) -> Dict:
+    def scan_library(self, library_name: str, progress_callback=None, limit: int = None, offset: int = 0,
+                     item_callback=None) -> Dict:
         """
         Scan a library for shows/movies and their artwork.
 
@@ -121,100 +424,347 @@ class PlexScannerAPI:
             progress_callback: Optional callback function(current, total, item_name)
             limit: Optional limit on number of items to scan (None = scan all)
             offset: Starting position for pagination (default 0)
+            item_callback: Optional callback function(item_data) called as each matching
+                item completes. When given, items are streamed to it instead of being
+                collected, and the returned 'items' list is empty.
 
         Returns:
-            Dict with 'items' (list of items with artwork) and 'total_count' (total items in library)
+            Dict with 'items' (list of items with artwork), 'total_count' (total items in library)
+            and 'matched_count' (items with custom artwork). Items hold ArtworkEntry tuples;
+            pass them through serialize_item() for JSON.
         """
-        if not self.plex:
-            if not self.connect():
-                return []
+        if not self._ensure_connected():
+            return {'items': [], 'total_count': 0}
 
-        print(f"\n[scan_library] Scanning library: '{library_name}'")
-        print(f"[scan_library] Using Plex API (professional approach)")
+        logger.info(f"[scan_library] Scanning library: '{library_name}'")
+        logger.info(f"[scan_library] Using Plex API (professional approach)")
 
         try:
-            library = self.plex.library.section(library_name)
-            print(f"[scan_library] Library type: {library.type}")
+            library = next((section for section in self._get_sections() if section.title == library_name), None)
+            if library is None:
+                raise NotFound(f"Unknown library section: {library_name}")
+            logger.info(f"[scan_library] Library type: {library.type}")
 
             items = []
-            all_content = library.all()
-            total_items = len(all_content)
+            matched_count = 0
+            deletable_count = 0
 
             # Apply offset and limit for pagination
             if limit and limit > 0:
+                # Fetch only the requested page; totalSize is a cheap count-only request
+                total_items = library.totalSize
                 end_pos = offset + limit
-                all_content = all_content[offset:end_pos]
-                print(f"[scan_library] Found {total_items} items in library (showing {offset+1}-{min(end_pos, total_items)})")
+                all_content = library.search(
+                    libtype=library.TYPE,
+                    container_start=offset,
+                    container_size=min(limit, 100),
+                    maxresults=limit
+                )
+                logger.info(f"[scan_library] Found {total_items} items in library (showing {offset+1}-{min(end_pos, total_items)})")
             else:
-                print(f"[scan_library] Found {total_items} items in library (scanning all)")
-
-            # Use threading to process items in parallel (5 workers for speed)
-            print(f"[scan_library] Processing {len(all_content)} items with parallel threads...")
-
-            def process_item(idx_content_tuple):
-                idx, content = idx_content_tuple
-                if idx < 5:
-                    print(f"\n[scan_library] Processing item {idx + 1}: {content.title}")
-                elif idx == 5:
-                    print(f"\n[scan_library] Processing remaining items (summary mode)...")
+                all_content = library.all()
+                total_items = len(all_content)
+                logger.info(f"[scan_library] Found {total_items} items in library (scanning all)")
+
+            # Use threading to process items in parallel (requests share the session pool)
+            logger.info(f"[scan_library] Processing {len(all_content)} items with {self.concurrency} parallel threads"
+                        f"{' (free-threaded, GIL disabled)' if _FREE_THREADED else ''}...")
+
+            # Cached listings older than the library's last update are ignored
+            library_updated = library.updatedAt.timestamp() if getattr(library, 'updatedAt', None) else 0
+            self._load_artwork_cache()
+            self._load_uploads_index()
+            cache_hits = 0
+            cache_lock = threading.Lock()
+
+            # Per-item details are logged for the first 5 items, and only at DEBUG level
+            log_details = logger.isEnabledFor(logging.DEBUG)
+
+            def process_item(idx, content):
+                nonlocal cache_hits
+                detailed = log_details and idx < 5
+                if detailed:
+                    logger.debug(f"[scan_library] Processing item {idx + 1}: {content.title}")
+                elif log_details and idx == 5:
+                    logger.debug(f"[scan_library] Processing remaining items (summary mode)...")
 
                 try:
-                    item_data = self._get_item_artwork(content, detailed=idx < 5)
+                    item_data = self._get_cached_artwork(content, library_updated)
+                    if item_data is not None:
+                        with cache_lock:
+                            cache_hits += 1
+                    else:
+                        item_data = self._get_item_artwork(content, detailed=detailed, item_type=library.type)
+                        if item_data is None:
+                            return None
+                        self._store_cached_artwork(content, item_data)
 
                     # FILTER: Only show items with custom artwork in Uploads folder
                     # This prevents showing items that only have agent posters (can't be deleted)
                     if item_data.get('has_custom_artwork', False):
-                        if idx < 5:
-                            print(f"  ✓ Has {item_data['custom_artwork_count']} deletable file(s) in Uploads folder")
+                        if detailed:
+                            logger.debug(f"  ✓ Has {item_data['custom_artwork_count']} deletable file(s) in Uploads folder")
                         return item_data
                     else:
-                        if idx < 5:
-                            print(f"  ✗ No custom artwork (only agent posters) - skipping")
+                        if detailed:
+                            logger.debug(f"  ✗ No custom artwork (only agent posters) - skipping")
                         return None
                 except Exception as e:
                     if idx < 5:
-                        print(f"[scan_library] ERROR processing {content.title}: {e}")
+                        logger.error(f"[scan_library] ERROR processing {content.title}: {e}")
                 return None
 
+            # Only titles are needed for progress; the submitted futures keep the items alive
+            titles = [content.title for content in all_content]
+
             # Process items in parallel with ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_item = {executor.submit(process_item, (idx, content)): idx
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='plex-scan') as executor:
+                future_to_item = {executor.submit(process_item, idx, content): idx
                                   for idx, content in enumerate(all_content)}
+                del all_content
 
+                completed = 0
+                last_progress = time.monotonic()
                 for future in as_completed(future_to_item):
-                    idx = future_to_item[future]
+                    idx = future_to_item.pop(future)
+                    completed += 1
                     if progress_callback:
-                        progress_callback(idx + 1, total_items, all_content[idx].title)
+                        now = time.monotonic()
+                        if (completed % PROGRESS_BATCH == 0 or completed == len(titles)
+                                or now - last_progress >= PROGRESS_INTERVAL):
+                            progress_callback(completed, total_items, titles[idx])
+                            last_progress = now
 
                     try:
                         item_data = future.result()
                         if item_data:
-                            items.append(item_data)
+                            matched_count += 1
+                            deletable_count += item_data.get('custom_artwork_count', 0)
+                            if item_callback:
+                                item_callback(item_data)
+                            else:
+                                items.append(item_data)
                     except Exception as e:
-                        print(f"[scan_library] ERROR in thread: {e}")
+                        logger.error(f"[scan_library] ERROR in thread: {e}")
+
+            self._flush_artwork_cache()
+            self._flush_uploads_index()
 
-            print(f"\n[scan_library] Scan complete!")
-            print(f"[scan_library] Total items with CUSTOM artwork: {len(items)}")
-            print(f"[scan_library] Total deletable files: {sum(item.get('custom_artwork_count', 0) for item in items)}")
+            logger.info(f"[scan_library] Scan complete!")
+            logger.info(f"[scan_library] Artwork cache hits: {cache_hits}/{len(titles)}")
+            logger.info(f"[scan_library] Total items with CUSTOM artwork: {matched_count}")
+            logger.info(f"[scan_library] Total deletable files: {deletable_count}")
 
             return {
                 'items': items,
-                'total_count': total_items
+                'total_count': total_items,
+                'matched_count': matched_count
             }
 
         except NotFound:
-            print(f"[scan_library] ERROR: Library '{library_name}' not found")
+            logger.error(f"[scan_library] ERROR: Library '{library_name}' not found")
             return {'items': [], 'total_count': 0}
         except Exception as e:
-            print(f"[scan_library] ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[scan_library] ERROR: {e}")
             return {'items': [], 'total_count': 0}
 
+    def _load_artwork_cache(self) -> Dict[str, tuple]:
+        """Load this server's cached artwork listings into memory (once per scanner)."""
+        if self._artwork_cache is not None:
+            return self._artwork_cache
+
+        self._artwork_cache = {}
+        try:
+            ARTWORK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(ARTWORK_CACHE_PATH))
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS artwork_cache ("
+                    "scope TEXT, rating_key TEXT, updated_at REAL, cached_at REAL, data TEXT, "
+                    "PRIMARY KEY (scope, rating_key))"
+                )
+                if self.plex_token:
+                    # Rows written before thumb URLs were stored without the token
+                    with conn:
+                        conn.execute(
+                            "DELETE FROM artwork_cache WHERE scope = ? AND instr(data, ?) > 0",
+                            (self._cache_scope, self.plex_token)
+                        )
+                cutoff = time.time() - ARTWORK_CACHE_TTL
+                for rating_key, updated_at, cached_at, data in conn.execute(
+                    "SELECT rating_key, updated_at, cached_at, data FROM artwork_cache "
+                    "WHERE scope = ? AND cached_at >= ?",
+                    (self._cache_scope, cutoff)
+                ):
+                    self._artwork_cache[rating_key] = (updated_at, cached_at, data)
+            finally:
+                conn.close()
+            logger.info(f"[artwork_cache] Loaded {len(self._artwork_cache)} cached listings")
+        except sqlite3.Error as e:
+            logger.info(f"[artwork_cache] Could not load artwork cache: {e}")
+
+        return self._artwork_cache
+
+    def _get_cached_artwork(self, item, library_updated: float) -> Optional[Dict]:
+        """
+        Return the cached artwork dict for an unchanged item, or None.
+
+        The Uploads folder can change without Plex touching updatedAt (another scanner,
+        the launcher, or by hand), so the file count is rechecked; that is stat-only
+        while the Uploads index is current.
+        """
+        updated_at = getattr(item, 'updatedAt', None)
+        if updated_at is None:
+            return None
+
+        cached = self._artwork_cache.get(str(item.ratingKey))
+        if not (cached and cached[0] == updated_at.timestamp() and cached[1] >= library_updated):
+            return None
+
+        data = cached[2]
+        if self.plex_token:
+            data = data.replace(_TOKEN_PLACEHOLDER, self.plex_token)
+        item_data = _deserialize_item(json.loads(data))
+        if self._get_uploads_file_count(item) != item_data['custom_artwork_count']:
+            return None
+        return item_data
+
+    def _store_cached_artwork(self, item, item_data: Dict):
+        """Queue an item's artwork dict to be written by _flush_artwork_cache()."""
+        updated_at = getattr(item, 'updatedAt', None)
+        if updated_at is None:
+            return
+
+        data = json.dumps(serialize_item(item_data))
+        if self.plex_token:
+            data = data.replace(self.plex_token, _TOKEN_PLACEHOLDER)
+        entry = (updated_at.timestamp(), time.time(), data)
+        self._artwork_cache[str(item.ratingKey)] = entry
+        self._pending_cache.append((self._cache_scope, str(item.ratingKey)) + entry)
+
+    def _flush_artwork_cache(self):
+        """Write newly cached listings and drop expired rows in a single transaction."""
+        pending, self._pending_cache = self._pending_cache, []
+        try:
+            conn = sqlite3.connect(str(ARTWORK_CACHE_PATH))
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO artwork_cache "
+                        "(scope, rating_key, updated_at, cached_at, data) VALUES (?, ?, ?, ?, ?)",
+                        pending
+                    )
+                    conn.execute(
+                        "DELETE FROM artwork_cache WHERE cached_at < ?",
+                        (time.time() - ARTWORK_CACHE_TTL,)
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.info(f"[artwork_cache] Could not save artwork cache: {e}")
+
+    def _invalidate_artwork_cache(self, rating_key: str):
+        """Forget the cached listing for an item whose artwork files changed."""
+        if self._artwork_cache is not None:
+            self._artwork_cache.pop(str(rating_key), None)
+        try:
+            conn = sqlite3.connect(str(ARTWORK_CACHE_PATH))
+            try:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM artwork_cache WHERE scope = ? AND rating_key = ?",
+                        (self._cache_scope, str(rating_key))
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.info(f"[artwork_cache] Could not invalidate cache entry: {e}")
+
+    def _load_uploads_index(self) -> Dict[str, tuple]:
+        """Load the persistent Uploads listing index into memory (once per scanner)."""
+        if self._uploads_index is not None:
+            return self._uploads_index
+
+        self._uploads_index = {}
+        try:
+            ARTWORK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(ARTWORK_CACHE_PATH))
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS uploads_index "
+                    "(uploads_dir TEXT PRIMARY KEY, dir_mtimes TEXT, files TEXT)"
+                )
+                for uploads_dir, dir_mtimes, files in conn.execute(
+                    "SELECT uploads_dir, dir_mtimes, files FROM uploads_index"
+                ):
+                    self._uploads_index[uploads_dir] = (json.loads(dir_mtimes), json.loads(files))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"[uploads_index] Could not load Uploads index: {e}")
+
+        return self._uploads_index
+
+    def _get_indexed_uploads(self, uploads_dir: str) -> Optional[List[str]]:
+        """
+        Return the indexed file list for an Uploads folder if no directory in it changed.
+
+        Costs one stat per indexed directory instead of a scandir per directory.
+        """
+        if self._uploads_index is None:
+            return None
+
+        indexed = self._uploads_index.get(uploads_dir)
+        if indexed is None:
+            return None
+
+        dir_mtimes, files = indexed
+        try:
+            for path, mtime_ns in dir_mtimes.items():
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return None
+        except OSError:
+            return None
+        return files
+
+    def _index_uploads(self, uploads_dir: str, dir_mtimes: Dict[str, int], files: List[str]):
+        """Queue a fresh Uploads listing to be written by _flush_uploads_index()."""
+        if self._uploads_index is None:
+            return
+        self._uploads_index[uploads_dir] = (dir_mtimes, files)
+        self._pending_uploads_index.append((uploads_dir, json.dumps(dir_mtimes), json.dumps(files)))
+
+    def _flush_uploads_index(self):
+        """Write all new Uploads listings in a single transaction."""
+        if not self._pending_uploads_index:
+            return
+
+        pending, self._pending_uploads_index = self._pending_uploads_index, []
+        try:
+            conn = sqlite3.connect(str(ARTWORK_CACHE_PATH))
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO uploads_index (uploads_dir, dir_mtimes, files) VALUES (?, ?, ?)",
+                        pending
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"[uploads_index] Could not save Uploads index: {e}")
+
     def _build_thumb_url(self, thumb_path: str, item_rating_key: str = None) -> str:
         """
         Build complete thumbnail URL, handling both relative and absolute URLs.
 
+        Results are memoized per scanner instance.
+        """
+        return self._thumb_url_cache(thumb_path, item_rating_key)
+
+    def _make_thumb_url(self, thumb_path: str, item_rating_key: str = None) -> str:
+        """
+        Build complete thumbnail URL (uncached - use _build_thumb_url).
+
         Args:
             thumb_path: Thumb path from PlexAPI (can be relative or absolute URL)
             item_rating_key: Optional rating key of the parent item (for fallback)
@@ -223,40 +773,67 @@ class PlexScannerAPI:
             Complete thumbnail URL with token
         """
         # If it's already a full URL (starts with http:// or https://)
-        if thumb_path.startswith('http://') or thumb_path.startswith('https://'):
+        if thumb_path.startswith(_EXTERNAL_URL_PREFIXES):
             # External URLs (Plex transcoder, TVDB, TMDB, etc.) - use as-is
             # These are already authenticated or publicly accessible
             return thumb_path
 
         # Handle internal Plex metadata references (metadata://, upload://, etc.)
-        if '/file?url=' in thumb_path or 'metadata://' in thumb_path or 'upload://' in thumb_path:
+        if _INTERNAL_REF_RE.search(thumb_path):
             # These are internal Plex references that don't work well as direct URLs
             # Use the item's thumb endpoint instead if available
             if item_rating_key:
-                return f"{self.plex_url}/library/metadata/{item_rating_key}/thumb?X-Plex-Token={self.plex_token}"
+                return f"{self.plex_url}/library/metadata/{item_rating_key}/thumb{self._token_qs}"
             # If no rating key, try to extract it from the path
             if '/library/metadata/' in thumb_path:
                 # Extract rating key from path like /library/metadata/303344/file?...
-                import re
-                match = re.search(r'/library/metadata/(\d+)/', thumb_path)
+                match = _META_RE.search(thumb_path)
                 if match:
                     rating_key = match.group(1)
-                    return f"{self.plex_url}/library/metadata/{rating_key}/thumb?X-Plex-Token={self.plex_token}"
+                    return f"{self.plex_url}/library/metadata/{rating_key}/thumb{self._token_qs}"
 
         # It's a relative path to local Plex server - prepend server URL and token
-        return f"{self.plex_url}{thumb_path}?X-Plex-Token={self.plex_token}"
+        return f"{self.plex_url}{thumb_path}{self._token_qs}"
 
-    def _get_item_artwork(self, item, detailed: bool = False) -> Dict:
+    def _submit_fetch(self, fetch) -> Future:
+        """Run an artwork list fetch on the fetch pool, or inline once the scanner is closed."""
+        try:
+            return self._fetch_executor.submit(fetch)
+        except RuntimeError:  # close() ran (e.g. a config change) while a scan was in progress
+            future = Future()
+            try:
+                future.set_result(fetch())
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+    def _get_item_artwork(self, item, detailed: bool = False, item_type: str = None) -> Optional[Dict]:
         """
         Get all artwork for a single item (show/movie).
 
         Args:
             item: PlexAPI item object
             detailed: Whether to print detailed logs
+            item_type: Library type ('show', 'movie', ...); defaults to item.type
 
         Returns:
-            Dictionary with item metadata and artwork
+            Dictionary with item metadata and artwork (lists of ArtworkEntry;
+            use serialize_item() before returning it as JSON), or None if the
+            item has no custom artwork in its Uploads folder
         """
+        # FILTER: Only show artwork that can actually be deleted (exists in Uploads folder)
+        # This prevents showing agent-provided posters that can't be deleted. The check is
+        # local, so do it first and skip the artwork requests for items that would be dropped.
+        uploads_file_count = self._get_uploads_file_count(item, debug=detailed)
+
+        if uploads_file_count == 0:
+            if detailed:
+                logger.debug(f"  [artwork] ✗ No custom artwork in Uploads folder")
+            return None
+
+        if detailed:
+            logger.debug(f"  [artwork] ✓ Found {uploads_file_count} deletable files in Uploads folder")
+
         artwork_data = {
             "posters": [],
             "art": [],  # Background artwork
@@ -264,101 +841,38 @@ class PlexScannerAPI:
             "themes": []
         }
 
-        # Get available posters
-        try:
-            posters = item.posters()
-            if detailed:
-                print(f"  [artwork] Found {len(posters)} posters")
-
-            for idx, poster in enumerate(posters):
-                # Use index as rating key since poster.ratingKey might be a URL
-                poster_key = f"poster_{idx}"
-                artwork_data["posters"].append({
-                    "path": f"{item.ratingKey}/poster/{poster_key}",  # Unique path for React keys
-                    "provider": poster.provider if hasattr(poster, 'provider') else "unknown",
-                    "selected": poster.selected if hasattr(poster, 'selected') else False,
-                    "thumb_url": self._build_thumb_url(poster.thumb, item.ratingKey),
-                    "rating_key": poster_key,
-                    "type": "poster"
-                })
-        except Exception as e:
-            if detailed:
-                print(f"  [artwork] No posters available: {e}")
-
-        # Get available art (backgrounds)
-        try:
-            arts = item.arts()
-            if detailed:
-                print(f"  [artwork] Found {len(arts)} background arts")
-
-            for idx, art in enumerate(arts):
-                art_key = f"art_{idx}"
-                artwork_data["art"].append({
-                    "path": f"{item.ratingKey}/art/{art_key}",  # Unique path for React keys
-                    "provider": art.provider if hasattr(art, 'provider') else "unknown",
-                    "selected": art.selected if hasattr(art, 'selected') else False,
-                    "thumb_url": self._build_thumb_url(art.thumb, item.ratingKey),
-                    "rating_key": art_key,
-                    "type": "background"
-                })
-        except Exception as e:
-            if detailed:
-                print(f"  [artwork] No background arts available: {e}")
-
-        # Get available banners (TV shows)
-        try:
-            banners = item.banners()
-            if detailed:
-                print(f"  [artwork] Found {len(banners)} banners")
-
-            for idx, banner in enumerate(banners):
-                banner_key = f"banner_{idx}"
-                artwork_data["banners"].append({
-                    "path": f"{item.ratingKey}/banner/{banner_key}",  # Unique path for React keys
-                    "provider": banner.provider if hasattr(banner, 'provider') else "unknown",
-                    "selected": banner.selected if hasattr(banner, 'selected') else False,
-                    "thumb_url": self._build_thumb_url(banner.thumb, item.ratingKey),
-                    "rating_key": banner_key,
-                    "type": "banner"
-                })
-        except Exception as e:
-            if detailed:
-                print(f"  [artwork] No banners available: {e}")
-
-        # Get available themes
-        try:
-            themes = item.themes()
-            if detailed:
-                print(f"  [artwork] Found {len(themes)} themes")
-
-            for idx, theme in enumerate(themes):
-                theme_key = f"theme_{idx}"
-                artwork_data["themes"].append({
-                    "path": f"{item.ratingKey}/theme/{theme_key}",  # Unique path for React keys
-                    "provider": theme.provider if hasattr(theme, 'provider') else "unknown",
-                    "selected": theme.selected if hasattr(theme, 'selected') else False,
-                    "thumb_url": self._build_thumb_url(theme.thumb, item.ratingKey),
-                    "rating_key": theme_key,
-                    "type": "theme"
-                })
-        except Exception as e:
-            if detailed:
-                print(f"  [artwork] No themes available: {e}")
+        # Banners only exist for shows - skip that request for everything else
+        is_show = (item_type or item.type) == 'show'
+        sources = [source for source in _ARTWORK_SOURCES if is_show or source[0] != "banners"]
 
-        # FILTER: Only show artwork that can actually be deleted (exists in Uploads folder)
-        # This prevents showing agent-provided posters that can't be deleted
-        uploads_file_count = self._get_uploads_file_count(item, debug=detailed)
+        # The lists are independent, so issue their requests concurrently
+        # (one item then costs the slowest round-trip instead of the sum)
+        futures = [
+            self._submit_fetch(getattr(item, source[1]))
+            for source in sources
+        ]
 
-        if uploads_file_count > 0:
-            # Mark that this item has deletable artwork
-            if detailed:
-                print(f"  [artwork] ✓ Found {uploads_file_count} deletable files in Uploads folder")
-        else:
-            # No custom artwork to delete - clear all artwork lists
-            if detailed:
-                print(f"  [artwork] ✗ No custom artwork in Uploads folder")
-            # Don't clear - we still want to show the posters for viewing
-            # But we could add a flag to indicate they're not deletable
+        for (out_key, method_name, key_prefix, artwork_type, label), future in zip(sources, futures):
+            try:
+                results = future.result()
+                if detailed:
+                    logger.debug(f"  [artwork] Found {len(results)} {label}")
+
+                entries = artwork_data[out_key]
+                for idx, artwork in enumerate(results):
+                    # Use index as rating key since artwork.ratingKey might be a URL
+                    artwork_key = f"{key_prefix}_{idx}"
+                    entries.append(ArtworkEntry(
+                        path=f"{item.ratingKey}/{key_prefix}/{artwork_key}",  # Unique path for React keys
+                        provider=getattr(artwork, 'provider', "unknown"),
+                        selected=getattr(artwork, 'selected', False),
+                        thumb_url=self._build_thumb_url(artwork.thumb, item.ratingKey),
+                        rating_key=artwork_key,
+                        type=artwork_type
+                    ))
+            except Exception as e:
+                if detailed:
+                    logger.debug(f"  [artwork] No {label} available: {e}")
 
         # Calculate total artwork
         total_artwork = (
@@ -374,7 +888,7 @@ class PlexScannerAPI:
                 "year": getattr(item, 'year', None),
                 "type": item.type,
                 "rating_key": item.ratingKey,
-                "guid": item.guid if hasattr(item, 'guid') else None,
+                "guid": getattr(item, 'guid', None),
                 "parent_title": getattr(item, 'parentTitle', None) if item.type == 'season' else None
             },
             "artwork": artwork_data,
@@ -383,126 +897,147 @@ class PlexScannerAPI:
             "custom_artwork_count": uploads_file_count  # NEW: How many deletable files
         }
 
+    def _resolve_plex_data_dir(self) -> Path:
+        """
+        Get the Plex data directory that relative metadataDirectory paths live under.
+
+        Resolved once per scanner (the transcoder lookup may hit the server) and
+        reused by every item in a scan and by delete_artwork.
+        """
+        if self._plex_data_dir is not None:
+            return self._plex_data_dir
+
+        with self._plex_data_dir_lock:
+            if self._plex_data_dir is not None:
+                return self._plex_data_dir
+
+            try:
+                # The transcoder path typically points to the Plex data directory
+                # Example: "C:\Users\...\AppData\Local\Plex Media Server\Plex Transcoder.exe"
+                plex_data_dir = Path(self.plex.transcodeDirectory).parent
+                logger.info(f"[PlexScannerAPI] Plex data directory (via transcoder): {plex_data_dir}")
+            except Exception as e:
+                logger.info(f"[PlexScannerAPI] Could not resolve via transcoder path: {e}")
+
+                # Fallback: common Plex data directory location for this platform
+                plex_data_dir = _DEFAULT_PLEX_DATA_DIR
+                logger.info(f"[PlexScannerAPI] Plex data directory (platform default): {plex_data_dir}")
+
+            self._plex_data_dir = plex_data_dir
+            return plex_data_dir
+
     def _get_uploads_file_count(self, item, debug: bool = False) -> int:
         """
         Check how many actual artwork files exist in the Uploads folder.
         Returns count of deletable files.
         """
         try:
-            if not hasattr(item, 'metadataDirectory'):
+            # metadataDirectory is computed (hash of the guid), so read it only once
+            metadata_dir_raw = getattr(item, 'metadataDirectory', None)
+            if metadata_dir_raw is None:
                 if debug:
-                    print(f"    [uploads_check] No metadataDirectory property")
+                    logger.debug(f"    [uploads_check] No metadataDirectory property")
                 return 0
 
-            metadata_dir_raw = item.metadataDirectory
-            metadata_dir = Path(metadata_dir_raw)
+            # Plain strings throughout - this runs once per item in a scan
+            metadata_dir = str(metadata_dir_raw)
 
             if debug:
-                print(f"    [uploads_check] Raw path: {metadata_dir_raw}")
+                logger.debug(f"    [uploads_check] Raw path: {metadata_dir_raw}")
 
             # Resolve relative paths
-            if not metadata_dir.is_absolute():
-                try:
-                    transcoder_path = self.plex.transcodeDirectory
-                    plex_data_dir = Path(transcoder_path).parent
-                    metadata_dir = plex_data_dir / metadata_dir_raw
-                    if debug:
-                        print(f"    [uploads_check] Resolved via transcoder: {metadata_dir}")
-                except Exception:
-                    system = platform.system()
-                    if system == 'Windows':
-                        plex_data_dir = Path(os.environ.get('LOCALAPPDATA')) / "Plex Media Server"
-                    elif system == 'Darwin':
-                        plex_data_dir = Path.home() / "Library" / "Application Support" / "Plex Media Server"
-                    else:
-                        plex_data_dir = Path("/var/lib/plexmediaserver/Library/Application Support/Plex Media Server")
-                    metadata_dir = plex_data_dir / metadata_dir_raw
-                    if debug:
-                        print(f"    [uploads_check] Resolved via platform default: {metadata_dir}")
-
-            if not metadata_dir.exists():
+            if not os.path.isabs(metadata_dir):
+                metadata_dir = os.path.join(self._resolve_plex_data_dir(), metadata_dir)
                 if debug:
-                    print(f"    [uploads_check] ✗ Metadata directory does not exist: {metadata_dir}")
-                return 0
+                    logger.debug(f"    [uploads_check] Resolved to: {metadata_dir}")
 
             if debug:
-                print(f"    [uploads_check] ✓ Metadata directory exists: {metadata_dir}")
+                if not os.path.isdir(metadata_dir):
+                    logger.debug(f"    [uploads_check] ✗ Metadata directory does not exist: {metadata_dir}")
+                    return 0
 
-            # Check what's actually in the metadata directory
-            if debug:
+                logger.debug(f"    [uploads_check] ✓ Metadata directory exists: {metadata_dir}")
+
+                # Check what's actually in the metadata directory
                 try:
-                    contents = list(metadata_dir.iterdir())
-                    print(f"    [uploads_check] Contents: {[f.name for f in contents[:10]]}")
+                    contents = os.listdir(metadata_dir)
+                    logger.debug(f"    [uploads_check] Contents: {contents[:10]}")
                 except Exception as e:
-                    print(f"    [uploads_check] Could not list directory: {e}")
+                    logger.debug(f"    [uploads_check] Could not list directory: {e}")
 
-            uploads_dir = metadata_dir / "Uploads"
-            if not uploads_dir.exists():
-                if debug:
-                    print(f"    [uploads_check] ✗ No Uploads folder at: {uploads_dir}")
-                return 0
+            # A missing metadata dir or Uploads folder fails the first scandir, no exists() probes needed
+            uploads_dir = os.path.join(metadata_dir, "Uploads")
+            upload_files = self._get_indexed_uploads(uploads_dir)
+            if upload_files is None:
+                dir_mtimes = {}
+                try:
+                    upload_files = _list_upload_files(uploads_dir, dir_mtimes)
+                except OSError:
+                    if debug:
+                        logger.debug(f"    [uploads_check] ✗ No Uploads folder at: {uploads_dir}")
+                    return 0
+                self._index_uploads(uploads_dir, dir_mtimes, upload_files)
 
-            if debug:
-                print(f"    [uploads_check] ✓ Uploads folder exists: {uploads_dir}")
-
-            # Count .jpg, .jpeg, .png files in Uploads subfolders
-            # Structure: Uploads/posters/*.jpg, Uploads/art/*.jpg, Uploads/themes/*.mp3
-            file_count = 0
-            all_files = []
-
-            # Check multiple subfolder patterns (posters, art, backgrounds, etc.)
-            subfolders = ['posters', 'art', 'backgrounds', 'banners', 'themes']
-
-            for subfolder in subfolders:
-                subfolder_path = uploads_dir / subfolder
-                if subfolder_path.exists():
-                    # FIX: Plex stores files WITHOUT extensions, so look for all files
-                    # Changed from looking for *.jpg, *.jpeg, *.png to all files
-                    files = [f for f in subfolder_path.iterdir() if f.is_file()]
-                    if files:
-                        file_count += len(files)
-                        if debug:
-                            all_files.extend([f"{subfolder}/{f.name}" for f in files])
-
-                    # Also check season subfolders (e.g., posters/seasons/1/)
-                    if subfolder == 'posters':
-                        seasons_dir = subfolder_path / 'seasons'
-                        if seasons_dir.exists():
-                            for season_folder in seasons_dir.iterdir():
-                                if season_folder.is_dir():
-                                    season_files = [f for f in season_folder.iterdir() if f.is_file()]
-                                    if season_files:
-                                        file_count += len(season_files)
-                                        if debug:
-                                            all_files.extend([f"{subfolder}/seasons/{season_folder.name}/{f.name}" for f in season_files])
-
-            # Also check root Uploads folder (some setups might put files there directly)
-            root_files = [f for f in uploads_dir.iterdir() if f.is_file()]
-            if root_files:
-                file_count += len(root_files)
-                if debug:
-                    all_files.extend([f.name for f in root_files])
+            file_count = len(upload_files)
+            if file_count:
+                with self._uploads_lock:
+                    self._uploads_cache[str(item.ratingKey)] = (time.monotonic(), upload_files)
 
             if debug:
+                logger.debug(f"    [uploads_check] ✓ Uploads folder exists: {uploads_dir}")
                 if file_count > 0:
-                    print(f"    [uploads_check] ✓ Found {file_count} file(s): {all_files[:5]}")
+                    all_files = [os.path.relpath(f, uploads_dir) for f in upload_files[:5]]
+                    logger.debug(f"    [uploads_check] ✓ Found {file_count} file(s): {all_files}")
                 else:
                     # Check if there are ANY files in Uploads folder
                     try:
-                        all_contents = list(uploads_dir.iterdir())
-                        print(f"    [uploads_check] ✗ No .jpg/.png files, but folder has: {[f.name for f in all_contents[:5]]}")
+                        all_contents = os.listdir(uploads_dir)
+                        logger.debug(f"    [uploads_check] ✗ No .jpg/.png files, but folder has: {all_contents[:5]}")
                     except Exception as e:
-                        print(f"    [uploads_check] ✗ Could not list Uploads folder: {e}")
+                        logger.debug(f"    [uploads_check] ✗ Could not list Uploads folder: {e}")
 
             return file_count
 
         except Exception as e:
             if debug:
-                print(f"    [uploads_check] ERROR: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"    [uploads_check] ERROR: {e}")
             return 0
 
+    def _get_file_manager(self):
+        """
+        Get the FileManager for deletions, rebuilt only when config.json changes.
+
+        Avoids re-reading config.json and re-creating the backup directory on
+        every delete_artwork call in a batch delete.
+        """
+        from file_manager import FileManager
+
+        try:
+            config_mtime = CONFIG_PATH.stat().st_mtime
+        except OSError:
+            config_mtime = None
+
+        if self._file_manager is None or config_mtime != self._config_mtime:
+            backup_dir = None
+            if config_mtime is not None:
+                with open(CONFIG_PATH, 'r') as f:
+                    backup_dir = json.load(f).get('backup_directory')
+            self._file_manager = FileManager(backup_dir=backup_dir)
+            self._config_mtime = config_mtime
+        else:
+            # The app's own FileManager (undo, cleanup) may have updated the log since
+            self._file_manager._load_operations()
+
+        return self._file_manager
+
+    def _pop_cached_uploads(self, rating_key: str) -> Optional[List[str]]:
+        """Take an item's Uploads file list from the last scan if it is still fresh."""
+        with self._uploads_lock:
+            cached = self._uploads_cache.pop(str(rating_key), None)
+        if cached and time.monotonic() - cached[0] < UPLOADS_CACHE_TTL:
+            return cached[1]
+        return None
+
     def delete_artwork(self, item_rating_key: str, artwork_path: str) -> Dict:
         """
         Delete artwork FILES from disk (not just unlock in Plex).
@@ -517,9 +1052,9 @@ class PlexScannerAPI:
         Returns:
             Dict with success status, files deleted, bytes freed, and backup info
         """
-        print(f"\n[delete_artwork] Processing FILESYSTEM deletion request")
-        print(f"[delete_artwork] Item rating key: {item_rating_key}")
-        print(f"[delete_artwork] Artwork path: {artwork_path}")
+        logger.info(f"[delete_artwork] Processing FILESYSTEM deletion request")
+        logger.info(f"[delete_artwork] Item rating key: {item_rating_key}")
+        logger.info(f"[delete_artwork] Artwork path: {artwork_path}")
 
         try:
             # Parse path to get artwork type
@@ -532,20 +1067,20 @@ class PlexScannerAPI:
                 }
 
             _, artwork_type, artwork_id = parts
-            print(f"[delete_artwork] Type: {artwork_type}, ID: {artwork_id}")
+            logger.info(f"[delete_artwork] Type: {artwork_type}, ID: {artwork_id}")
 
             # Fetch the item from Plex
-            print(f"[delete_artwork] Fetching item with rating key: {item_rating_key}")
+            logger.info(f"[delete_artwork] Fetching item with rating key: {item_rating_key}")
             try:
-                item = self.plex.fetchItem(int(item_rating_key))
-                print(f"[delete_artwork] Found item: {item.title}")
+                item = self._get_item(item_rating_key)
+                logger.info(f"[delete_artwork] Found item: {item.title}")
             except Exception as e:
-                print(f"[delete_artwork] fetchItem failed: {e}, trying alternative method...")
+                logger.info(f"[delete_artwork] fetchItem failed: {e}, trying alternative method...")
                 # Alternative: search through all libraries
-                for section in self.plex.library.sections():
+                for section in self._get_sections():
                     try:
                         item = section.fetchItem(int(item_rating_key))
-                        print(f"[delete_artwork] Found item via library search: {item.title}")
+                        logger.info(f"[delete_artwork] Found item via library search: {item.title}")
                         break
                     except:
                         continue
@@ -553,48 +1088,24 @@ class PlexScannerAPI:
                     raise Exception(f"Could not find item with rating key: {item_rating_key}")
 
             # Get the metadata directory for this item
-            if not hasattr(item, 'metadataDirectory'):
+            metadata_dir_raw = getattr(item, 'metadataDirectory', None)
+            if metadata_dir_raw is None:
                 return {
                     "success": False,
                     "error": f"Item type '{item.type}' does not have metadataDirectory property"
                 }
 
-            metadata_dir_raw = item.metadataDirectory
-            print(f"[delete_artwork] Raw metadata directory: {metadata_dir_raw}")
+            logger.info(f"[delete_artwork] Raw metadata directory: {metadata_dir_raw}")
 
             # PlexAPI sometimes returns relative paths like "Metadata\\TV Shows\\..."
             # We need to convert to absolute path using Plex data directory
             metadata_dir = Path(metadata_dir_raw)
 
             if not metadata_dir.is_absolute():
-                # Get Plex data directory from server
-                print(f"[delete_artwork] Path is relative, finding Plex data directory...")
-
-                # Try to get from Plex server transcoder path
-                try:
-                    # The transcoder path typically points to the Plex data directory
-                    # Example: "C:\Users\...\AppData\Local\Plex Media Server\Plex Transcoder.exe"
-                    transcoder_path = self.plex.transcodeDirectory
-                    plex_data_dir = Path(transcoder_path).parent
-                    metadata_dir = plex_data_dir / metadata_dir_raw
-                    print(f"[delete_artwork] Resolved to absolute path: {metadata_dir}")
-                except Exception as e:
-                    print(f"[delete_artwork] Could not resolve via transcoder path: {e}")
-
-                    # Fallback: Try common Plex data directory locations
-                    system = platform.system()
+                metadata_dir = self._resolve_plex_data_dir() / metadata_dir_raw
+                logger.info(f"[delete_artwork] Resolved to absolute path: {metadata_dir}")
 
-                    if system == 'Windows':
-                        plex_data_dir = Path(os.environ.get('LOCALAPPDATA')) / "Plex Media Server"
-                    elif system == 'Darwin':  # macOS
-                        plex_data_dir = Path.home() / "Library" / "Application Support" / "Plex Media Server"
-                    else:  # Linux
-                        plex_data_dir = Path("/var/lib/plexmediaserver/Library/Application Support/Plex Media Server")
-
-                    metadata_dir = plex_data_dir / metadata_dir_raw
-                    print(f"[delete_artwork] Using platform default: {metadata_dir}")
-
-            print(f"[delete_artwork] Final metadata directory: {metadata_dir}")
+            logger.info(f"[delete_artwork] Final metadata directory: {metadata_dir}")
 
             if not metadata_dir.exists():
                 return {
@@ -605,109 +1116,88 @@ class PlexScannerAPI:
 
             # Look for Uploads subfolder
             uploads_dir = metadata_dir / "Uploads"
-            print(f"[delete_artwork] Checking uploads directory: {uploads_dir}")
+            logger.info(f"[delete_artwork] Checking uploads directory: {uploads_dir}")
 
             if not uploads_dir.exists():
-                print(f"[delete_artwork] No Uploads folder found - no custom artwork to delete")
+                logger.info(f"[delete_artwork] No Uploads folder found - no custom artwork to delete")
                 return {
                     "success": False,
                     "error": f"No Uploads folder found in {metadata_dir}",
                     "info": "This item has no custom uploaded artwork to delete"
                 }
 
-            # Find artwork files in Uploads folder and subfolders
-            # Structure: Uploads/posters/*.jpg, Uploads/art/*.jpg, etc.
-            artwork_files = []
-
-            # Check subfolders first (posters, art, backgrounds, banners, themes)
-            subfolders = ['posters', 'art', 'backgrounds', 'banners', 'themes']
-            for subfolder in subfolders:
-                subfolder_path = uploads_dir / subfolder
-                if subfolder_path.exists():
-                    # FIX: Plex stores files WITHOUT extensions, so look for all files
-                    # Changed from looking for *.jpg, *.jpeg, *.png to all files
-                    files = [f for f in subfolder_path.iterdir() if f.is_file()]
-                    artwork_files.extend(files)
-
-                    # Also check season subfolders (e.g., posters/seasons/1/)
-                    if subfolder == 'posters':
-                        seasons_dir = subfolder_path / 'seasons'
-                        if seasons_dir.exists():
-                            for season_folder in seasons_dir.iterdir():
-                                if season_folder.is_dir():
-                                    season_files = [f for f in season_folder.iterdir() if f.is_file()]
-                                    artwork_files.extend(season_files)
-
-            # Also check root Uploads folder (some setups might put files there directly)
-            root_files = [f for f in uploads_dir.iterdir() if f.is_file()]
-            artwork_files.extend(root_files)
+            # Find artwork files in Uploads folder and subfolders, reusing the listing
+            # from a recent scan when there is one (files deleted since are skipped)
+            cached_files = self._pop_cached_uploads(item_rating_key)
+            if cached_files is not None:
+                logger.info(f"[delete_artwork] Using Uploads listing from recent scan")
+                artwork_files = [f for f in cached_files if os.path.isfile(f)]
+            else:
+                artwork_files = _list_upload_files(str(uploads_dir))
 
             if not artwork_files:
-                print(f"[delete_artwork] No artwork files found in Uploads folder or subfolders")
+                logger.info(f"[delete_artwork] No artwork files found in Uploads folder or subfolders")
                 return {
                     "success": False,
                     "error": "No artwork files found in Uploads folder",
                     "info": "Uploads folder exists but contains no image files in posters/art/backgrounds subfolders"
                 }
 
-            print(f"[delete_artwork] Found {len(artwork_files)} artwork files to delete")
-            for f in artwork_files:
-                print(f"  - {f.name} ({f.stat().st_size} bytes)")
+            logger.info(f"[delete_artwork] Found {len(artwork_files)} artwork files to delete")
+            if logger.isEnabledFor(logging.DEBUG):
+                for f in artwork_files:
+                    logger.debug(f"  - {os.path.basename(f)}")
 
-            # Initialize file manager with backup directory from config
-            from file_manager import FileManager
-            import json
-            config_path = Path(__file__).parent.parent / "config.json"
-            backup_dir = None
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    backup_dir = config.get('backup_directory')
-
-            file_manager = FileManager(backup_dir=backup_dir)
+            # File manager with backup directory from config
+            file_manager = self._get_file_manager()
 
             # Delete files using file manager (moves to backup)
             deleted_files = []
             total_bytes = 0
             failed = []
 
-            for artwork_file in artwork_files:
-                file_size = artwork_file.stat().st_size
-                result = file_manager.delete_file(
-                    str(artwork_file),
-                    reason=f"Deleted via Plex Poster Manager - {item.title}"
-                )
+            # One batch: moves overlap across threads and the operations log is written
+            # once; each result carries the size it moved, so no separate stat here.
+            # Paths stay plain strings end to end (no Path round trips per file).
+            results = file_manager.delete_files(
+                artwork_files,
+                reason=f"Deleted via Plex Poster Manager - {item.title}",
+                max_workers=DELETE_WORKERS
+            )
 
+            for artwork_file, result in zip(artwork_files, results):
                 if result['success']:
-                    deleted_files.append(str(artwork_file))
+                    file_size = result['bytes_freed']
+                    deleted_files.append(artwork_file)
                     total_bytes += file_size
-                    print(f"[delete_artwork] ✓ Deleted: {artwork_file.name} ({file_size} bytes)")
+                    logger.debug(f"[delete_artwork] ✓ Deleted: {os.path.basename(artwork_file)} ({file_size} bytes)")
                 else:
                     failed.append({
-                        "file": str(artwork_file),
+                        "file": artwork_file,
                         "error": result.get('error')
                     })
-                    print(f"[delete_artwork] ✗ Failed: {artwork_file.name} - {result.get('error')}")
+                    logger.warning(f"[delete_artwork] ✗ Failed: {os.path.basename(artwork_file)} - {result.get('error')}")
+
+            # Uploads changed, so the cached listing for this item is stale
+            self._invalidate_artwork_cache(item_rating_key)
 
             # Trigger Plex to refresh metadata after file deletion
-            print(f"[delete_artwork] Triggering Plex metadata refresh...")
-            try:
-                item.refresh()
-                print(f"[delete_artwork] ✓ Plex refresh triggered")
-            except Exception as e:
-                print(f"[delete_artwork] Warning: Plex refresh failed: {e}")
+            logger.info(f"[delete_artwork] Scheduling Plex metadata refresh...")
+            self._schedule_refresh(item)
 
             if deleted_files:
-                print(f"[delete_artwork] ✓ Successfully deleted {len(deleted_files)} files ({total_bytes} bytes)")
+                deleted_count = len(deleted_files)
+                mb_freed = round(total_bytes / _BYTES_PER_MB, 2)
+                logger.info(f"[delete_artwork] ✓ Successfully deleted {deleted_count} files ({total_bytes} bytes)")
                 return {
                     "success": True,
-                    "deleted_count": len(deleted_files),
+                    "deleted_count": deleted_count,
                     "deleted_files": deleted_files,
                     "bytes_freed": total_bytes,
-                    "mb_freed": round(total_bytes / (1024 * 1024), 2),
+                    "mb_freed": mb_freed,
                     "failed": failed,
                     "item_title": item.title,
-                    "message": f"Deleted {len(deleted_files)} artwork files for {item.title} ({round(total_bytes / (1024 * 1024), 2)} MB freed)"
+                    "message": f"Deleted {deleted_count} artwork files for {item.title} ({mb_freed} MB freed)"
                 }
             else:
                 return {
@@ -718,15 +1208,88 @@ class PlexScannerAPI:
 
         except NotFound:
             error = f"Item not found with rating key: {item_rating_key}"
-            print(f"[delete_artwork] ERROR: {error}")
+            logger.error(f"[delete_artwork] ERROR: {error}")
             return {"success": False, "error": error}
         except Exception as e:
             error = f"Failed to delete artwork: {str(e)}"
-            print(f"[delete_artwork] ERROR: {error}")
-            import traceback
-            traceback.print_exc()
+            # A batch delete can fail the same way for every item; tracebacks only at DEBUG
+            logger.error(f"[delete_artwork] ERROR: {error}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"success": False, "error": error}
 
+    def _get_item(self, rating_key):
+        """
+        Fetch an item by rating key, reusing one fetched in the last ITEM_CACHE_TTL seconds.
+
+        A batch delete calls delete_artwork once per artwork path, often several
+        times for the same item; this saves a metadata request for each repeat.
+        """
+        key = str(rating_key)
+        now = time.monotonic()
+        with self._item_cache_lock:
+            cached = self._item_cache.get(key)
+            if cached and now - cached[0] < ITEM_CACHE_TTL:
+                self._item_cache.move_to_end(key)
+                return cached[1]
+
+        item = self.plex.fetchItem(int(rating_key))
+
+        with self._item_cache_lock:
+            self._item_cache[key] = (now, item)
+            self._item_cache.move_to_end(key)
+            while len(self._item_cache) > ITEM_CACHE_SIZE:
+                self._item_cache.popitem(last=False)
+        return item
+
+    def _forget_item(self, rating_key):
+        """Drop a cached item once Plex has been told to refresh it."""
+        with self._item_cache_lock:
+            self._item_cache.pop(str(rating_key), None)
+
+    def _schedule_refresh(self, item):
+        """
+        Refresh an item in Plex once deletions for it have settled.
+
+        Back-to-back delete_artwork calls for the same item (e.g. clearing each
+        artwork type in turn) collapse into a single refresh, sent
+        REFRESH_DEBOUNCE seconds after the last of them.
+        """
+        rating_key = str(item.ratingKey)
+        timer = threading.Timer(REFRESH_DEBOUNCE, self._submit_refresh, args=(rating_key, item))
+        timer.daemon = True
+        with self._refresh_lock:
+            previous = self._pending_refresh.get(rating_key)
+            if previous is not None:
+                previous.cancel()
+                logger.debug(f"[refresh] Coalesced refresh for: {item.title}")
+            self._pending_refresh[rating_key] = timer
+        timer.start()
+
+    def _submit_refresh(self, rating_key: str, item):
+        """Timer callback for _schedule_refresh: queue the refresh on the refresh pool."""
+        with self._refresh_lock:
+            if self._pending_refresh.get(rating_key) is threading.current_thread():
+                del self._pending_refresh[rating_key]
+        try:
+            self._refresh_executor.submit(self._run_refresh, rating_key, item)
+        except RuntimeError:  # scanner closed while this timer was firing
+            self._run_refresh(rating_key, item)
+
+    def _run_refresh(self, rating_key: str, item):
+        """Refresh an item in Plex, logging instead of raising (runs in the background)."""
+        try:
+            item.refresh()
+            self._forget_item(rating_key)
+            logger.info(f"[refresh] ✓ Plex refresh triggered for: {item.title}")
+        except Exception as e:
+            logger.warning(f"[refresh] Warning: Plex refresh failed for {item.title}: {e}")
+
+    def _cancel_scheduled_refresh(self, rating_key: str):
+        """Drop a pending debounced refresh (the caller is refreshing right now)."""
+        with self._refresh_lock:
+            timer = self._pending_refresh.pop(str(rating_key), None)
+        if timer is not None:
+            timer.cancel()
+
     def refresh_metadata(self, rating_key: str) -> bool:
         """
         Trigger Plex to refresh metadata for an item.
@@ -738,14 +1301,41 @@ class PlexScannerAPI:
             True if successful
         """
         try:
-            item = self.plex.fetchItem(rating_key)
+            item = self._get_item(rating_key)
+            self._cancel_scheduled_refresh(rating_key)
             item.refresh()
-            print(f"[refresh_metadata] Triggered refresh for: {item.title}")
+            self._forget_item(rating_key)
+            logger.info(f"[refresh_metadata] Triggered refresh for: {item.title}")
             return True
         except Exception as e:
-            print(f"[refresh_metadata] ERROR: {e}")
+            logger.error(f"[refresh_metadata] ERROR: {e}")
             return False
 
+    def close(self):
+        """Close the pooled HTTP connections to the Plex server."""
+        # Send debounced refreshes now rather than dropping them; queued ones still run
+        with self._refresh_lock:
+            pending = list(self._pending_refresh.items())
+            self._pending_refresh.clear()
+        for rating_key, timer in pending:
+            timer.cancel()
+            self._refresh_executor.submit(self._run_refresh, rating_key, *timer.args[1:])
+        self._refresh_executor.shutdown(wait=False)
+        self._fetch_executor.shutdown(wait=False)
+        self._session.close()
+        self._thumb_url_cache.cache_clear()
+        self._libraries_cache = None
+        self._sections_cache = None
+        self._uploads_cache.clear()
+        self._item_cache.clear()
+        self.plex = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 def detect_plex_url() -> Optional[str]:
     """
@@ -754,23 +1344,40 @@ def detect_plex_url() -> Optional[str]:
     Returns:
         Plex server URL or None
     """
-    # Try common local URLs
-    common_urls = [
-        "http://localhost:32400",
-        "http://127.0.0.1:32400",
-        "http://0.0.0.0:32400"
-    ]
+    global _detected_url
 
-    import requests
+    def probe(identity_url):
+        return _detect_session.get(identity_url, timeout=2).status_code == 200
 
-    for url in common_urls:
+    if _detected_url:
+        found_at, url = _detected_url
+        if time.monotonic() - found_at < DETECT_CACHE_TTL:
+            return url
+        # Last known good address first; it is almost always still right
         try:
-            response = requests.get(f"{url}/identity", timeout=2)
-            if response.status_code == 200:
-                print(f"[detect_plex_url] Found Plex server at: {url}")
+            if probe(f"{url}/identity"):
+                _detected_url = (time.monotonic(), url)
                 return url
-        except:
-            continue
+        except Exception:
+            pass
+
+    # Probe all candidates at once so a dead address costs one timeout, not one each
+    pool = ThreadPoolExecutor(max_workers=len(_COMMON_PLEX_URLS), thread_name_prefix='plex-detect')
+    futures = {pool.submit(probe, identity_url): url for url, identity_url in _COMMON_PLEX_URLS}
+    try:
+        for future in as_completed(futures):
+            try:
+                found = future.result()
+            except Exception:
+                continue
+            if found:
+                url = futures[future]
+                _detected_url = (time.monotonic(), url)
+                logger.info(f"[detect_plex_url] Found Plex server at: {url}")
+                return url
+    finally:
+        # Don't wait on the slower probes once one has answered
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    print(f"[detect_plex_url] No local Plex server found")
+    logger.info(f"[detect_plex_url] No local Plex server found")
     return None
@@ -0,0 +1,17 @@
+"""pytest fixtures for the Playwright UI scripts: one browser for the whole session."""
+
+import pytest
+
+from ui_test_utils import launch_browser, open_page
+
+
+@pytest.fixture(scope="session")
+def browser_context():
+    with launch_browser() as context:
+        yield context
+
+
+@pytest.fixture
+def page(browser_context):
+    with open_page(browser_context) as page:
+        yield page
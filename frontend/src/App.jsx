@@ -495,6 +495,7 @@ function App() {
             <div className="flex items-center gap-2">
               {/* Dark Mode Toggle */}
               <button
+                data-testid="dark-mode-toggle"
                 onClick={() => setDarkMode(!darkMode)}
                 className={`p-3 rounded-lg transition-all ${darkMode ? 'bg-gray-700 hover:bg-gray-600 text-yellow-400' : 'bg-white/20 hover:bg-white/30 text-white'}`}
                 title={darkMode ? 'Switch to Light Mode' : 'Switch to Dark Mode'}
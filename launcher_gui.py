@@ -4,42 +4,174 @@ Plex Poster Manager GUI Launcher
 Provides a modern GUI to launch and manage both backend and frontend servers.
 """
 
-try:
-    import customtkinter as ctk
-    from tkinter import filedialog, messagebox
-    CTK_AVAILABLE = True
-except ImportError:
-    # Fallback to regular tkinter if CustomTkinter not available
-    import tkinter as tk
-    from tkinter import ttk, filedialog, messagebox, scrolledtext
-    CTK_AVAILABLE = False
+# Plain tkinter/ttk: the UI below is built with ttk widgets only, so CustomTkinter
+# (slow to import, and it left tk/ttk undefined when present) is not loaded
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, scrolledtext
 
 import subprocess
 import threading
 import os
 import sys
 import json
+import copy
+import functools
 import signal
 import platform
-import webbrowser
 from pathlib import Path
 import time
-import requests
+import queue
+import selectors
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Determine project root
 PROJECT_ROOT = Path(__file__).parent.absolute()
 BACKEND_DIR = PROJECT_ROOT / "backend"
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 CONFIG_FILE = PROJECT_ROOT / "config.json"
+DEP_CACHE_FILE = PROJECT_ROOT / ".dep_cache.json"
+
+IS_WINDOWS = platform.system() == "Windows"
 
 # Platform-specific paths
-if platform.system() == "Windows":
+if IS_WINDOWS:
     VENV_PYTHON = BACKEND_DIR / "venv" / "Scripts" / "python.exe"
+    BACKEND_PIP = BACKEND_DIR / "venv" / "Scripts" / "pip.exe"
     NPM_CMD = "npm.cmd"
 else:
     VENV_PYTHON = BACKEND_DIR / "venv" / "bin" / "python"
+    BACKEND_PIP = BACKEND_DIR / "venv" / "bin" / "pip"
     NPM_CMD = "npm"
 
+# Frontend paths checked by the dependency scan
+FRONTEND_NODE_MODULES = FRONTEND_DIR / "node_modules"
+FRONTEND_LUCIDE = FRONTEND_NODE_MODULES / "lucide-react"
+FRONTEND_PKG_JSON = FRONTEND_DIR / "package.json"
+
+
+def _open_url(url):
+    """Open a URL in the default browser (webbrowser is only imported when needed)."""
+    import webbrowser
+    webbrowser.open(url)
+
+
+def _stat_or_none(path):
+    """os.stat() a path, returning None if it doesn't exist."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class _PosixProcessControl:
+    """Server process handling on macOS/Linux."""
+
+    # Server pipes can be multiplexed with select()
+    select_pipes = True
+
+    def popen_kwargs(self):
+        # Own session/process group, so stopping signals npm's node children too
+        # (and never the launcher's own group)
+        return {"start_new_session": True}
+
+    def terminate(self, process):
+        # SIGINT (Ctrl+C): Flask and react-scripts both shut down on it promptly.
+        # The server leads its own group, so its pid is the group id, which still
+        # reaches node children left behind if npm itself has already exited.
+        os.killpg(process.pid, signal.SIGINT)
+
+    def kill(self, process):
+        os.killpg(process.pid, signal.SIGKILL)
+
+    def wait(self, process, timeout):
+        """
+        Wait for a server to exit.
+
+        On Linux a pidfd wakes us as soon as it exits; Popen.wait() would poll
+        with growing sleeps instead.
+        """
+        if hasattr(os, "pidfd_open") and process.returncode is None:
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pass  # Already gone, or pidfds unsupported by this kernel
+            else:
+                try:
+                    with selectors.DefaultSelector() as selector:
+                        selector.register(pidfd, selectors.EVENT_READ)
+                        selector.select(timeout)
+                finally:
+                    os.close(pidfd)
+                if process.poll() is None:
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+                return process.returncode
+        return process.wait(timeout=timeout)
+
+
+class _WindowsProcessControl:
+    """Server process handling on Windows."""
+
+    # select() only works on sockets on Windows
+    select_pipes = False
+
+    def popen_kwargs(self):
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+
+    def terminate(self, process):
+        process.terminate()
+
+    def kill(self, process):
+        process.kill()
+
+    def wait(self, process, timeout):
+        return process.wait(timeout=timeout)
+
+
+# Chosen once at import; start_servers/stop_servers just call through it
+PROCESS_CONTROL = _WindowsProcessControl() if IS_WINDOWS else _PosixProcessControl()
+
+# Bytes read from a server's output pipe at a time
+OUTPUT_READ_SIZE = 65536
+
+# Frontend output lines starting with any of these are not logged
+FRONTEND_NOISE_PREFIXES = ("webpack",)
+
+# How often (ms) log lines from background threads are written to the console
+LOG_POLL_MS = 50
+
+# Console line cap: past LOG_MAX_LINES the oldest lines are dropped down to LOG_KEEP_LINES
+LOG_MAX_LINES = 5000
+LOG_KEEP_LINES = 4000
+
+# Lines of pip/npm output shown in the error dialog when an install fails
+INSTALL_OUTPUT_TAIL = 20
+
+# Seconds a "Check for Updates" result is reused for repeat clicks
+UPDATE_CHECK_TTL = 600
+
+# Seconds a passed "Test Token" result is reused for the same URL and token
+TOKEN_TEST_TTL = 30
+
+# The frontend is started once the backend answers its health check
+BACKEND_HEALTH_URL = "http://localhost:5000/api/health"
+BACKEND_READY_POLL = 0.1  # seconds between health checks
+BACKEND_READY_TIMEOUT = 30  # give up waiting and start the frontend anyway
+
+# Seconds servers get to exit after Stop before they are killed, and after that
+SERVER_STOP_TIMEOUT = 2
+SERVER_KILL_TIMEOUT = 1
+
+# Last config.json read or written: ((mtime_ns, size), parsed config)
+_config_cache = None
+
+
+def _config_file_key():
+    """Cheap change check for config.json; size also catches same-mtime rewrites."""
+    st = CONFIG_FILE.stat()
+    return (st.st_mtime_ns, st.st_size)
+
 
 class PlexPosterManagerLauncher:
     def __init__(self, root):
@@ -52,28 +184,67 @@ class PlexPosterManagerLauncher:
         self.backend_process = None
         self.frontend_process = None
 
+        # Server output readers, see _watch_output
+        self._output_selector = selectors.DefaultSelector()
+        self._reader_lock = threading.Lock()
+        self._reader_thread = None
+
+        # True while a dependency install runs in the background
+        self.setup_running = False
+
+        # package.json check result keyed by mtimes (see _new_packages_missing)
+        self._dep_cache = None
+
+        # Set once a dependency check passes; later checks are skipped until an update
+        self._deps_ok = False
+
+        # Last update check result, see check_for_updates: (checked_at, result)
+        self._update_cache = None
+
+        # Passed token tests: (url, token) -> (friendly_name, version, tested_at)
+        self._token_cache = {}
+
+        # Keep-alive connections for Plex probes and GitHub update checks, see _get_http
+        self._http = None
+        self._http_lock = threading.Lock()
+
+        # Log lines waiting to be written to the console (see log())
+        self._log_queue = queue.Queue()
+        self._log_flush_pending = False
+        self.log_text = None
+
         # Configuration
         self.config = self.load_config()
 
-        # Setup UI
-        self.setup_ui()
+        # Setup UI: configuration and controls first, the console once the window is up
+        self.setup_ui_essential()
+        self.root.after_idle(self.setup_ui_deferred)
+
+        # Pick up log lines from the server reader and worker threads
+        self.root.after(LOG_POLL_MS, self._poll_log_queue)
 
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         # Check dependencies
-        self.root.after(100, self.check_dependencies)
+        self._check_dependencies_in_background()
 
         # Auto-start if configured
         if self.config.get("auto_start_servers", False):
             self.root.after(2000, self.auto_start)
 
     def load_config(self):
-        """Load configuration from file."""
+        """Load configuration from file (parsed again only after the file changes)."""
+        global _config_cache
         if CONFIG_FILE.exists():
             try:
+                key = _config_file_key()
+                if _config_cache and _config_cache[0] == key:
+                    return copy.deepcopy(_config_cache[1])
                 with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                    config = json.load(f)
+                _config_cache = (key, copy.deepcopy(config))
+                return config
             except Exception as e:
                 print(f"Error loading config: {e}")
                 return self.get_default_config()
@@ -91,10 +262,29 @@ class PlexPosterManagerLauncher:
         }
 
     def save_config(self):
-        """Save configuration to file."""
+        """
+        Save configuration to file.
+
+        Nothing is written when config.json already holds this configuration.
+        Otherwise it is written to a temporary file that replaces config.json, so
+        an interrupted save can't leave a truncated file behind.
+        """
+        global _config_cache
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if (_config_cache and _config_cache[1] == self.config
+                    and CONFIG_FILE.exists() and _config_file_key() == _config_cache[0]):
+                self.log("✓ Configuration unchanged")
+                return True
+
+            fd, tmp_path = tempfile.mkstemp(dir=str(PROJECT_ROOT), prefix=".config-", suffix=".json")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.config, f, indent=2)
+                os.replace(tmp_path, CONFIG_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            _config_cache = (_config_file_key(), copy.deepcopy(self.config))
             self.log("✓ Configuration saved successfully")
             return True
         except Exception as e:
@@ -102,11 +292,12 @@ class PlexPosterManagerLauncher:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
             return False
 
-    def setup_ui(self):
-        """Set up the user interface."""
+    def setup_ui_essential(self):
+        """Set up the title, configuration and control sections of the user interface."""
         # Main container with padding
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky="nsew")
+        self._main_frame = main_frame
 
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
@@ -139,7 +330,8 @@ class PlexPosterManagerLauncher:
         url_entry = ttk.Entry(url_frame, textvariable=self.url_var, width=50)
         url_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
 
-        ttk.Button(url_frame, text="Auto-Detect", command=self.auto_detect_url).pack(side="left")
+        self.detect_button = ttk.Button(url_frame, text="Auto-Detect", command=self.auto_detect_url)
+        self.detect_button.pack(side="left")
 
         # Plex Token (REQUIRED for v2.0)
         token_label_frame = ttk.Frame(config_frame)
@@ -161,7 +353,8 @@ class PlexPosterManagerLauncher:
 
         ttk.Checkbutton(token_frame, text="Show", variable=self.token_show_var,
                         command=self.toggle_token_visibility).pack(side="left", padx=2)
-        ttk.Button(token_frame, text="Test Token", command=self.test_token).pack(side="left")
+        self.test_button = ttk.Button(token_frame, text="Test Token", command=self.test_token)
+        self.test_button.pack(side="left")
 
         # Token help text with link
         token_help_frame = ttk.Frame(config_frame)
@@ -176,7 +369,7 @@ class PlexPosterManagerLauncher:
                               text="https://support.plex.tv/articles/204059436",
                               foreground="blue", font=("Helvetica", 8), cursor="hand2")
         token_link.pack(side="left", padx=5)
-        token_link.bind("<Button-1>", lambda e: webbrowser.open("https://support.plex.tv/articles/204059436-finding-an-authentication-token-x-plex-token/"))
+        token_link.bind("<Button-1>", lambda e: _open_url("https://support.plex.tv/articles/204059436-finding-an-authentication-token-x-plex-token/"))
 
         # Auto-start checkbox
         self.auto_start_var = tk.BooleanVar(value=self.config.get("auto_start_servers", False))
@@ -215,6 +408,14 @@ class PlexPosterManagerLauncher:
                                         command=self.clear_console)
         self.clear_button.pack(side="left", padx=5, fill="x", expand=True)
 
+    def setup_ui_deferred(self):
+        """
+        Set up the console and status bar (run from the first idle pass).
+
+        Lines logged before the console exists stay queued and are written here.
+        """
+        main_frame = self._main_frame
+
         # --- Log Output Section ---
         log_frame = ttk.LabelFrame(main_frame, text="Server Output", padding="10")
         log_frame.grid(row=3, column=0, columnspan=2, sticky="nsew", pady=(0, 10))
@@ -237,37 +438,173 @@ class PlexPosterManagerLauncher:
                                           foreground="gray")
         self.frontend_status.pack(side="left", padx=10)
 
+        self._flush_log()
+
     def log(self, message):
-        """Add message to log output."""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """
+        Add message to log output. Safe to call from any thread.
+
+        Lines are queued and written to the console in batches on the Tk thread:
+        on the next idle pass when logged from the Tk thread, or by the
+        LOG_POLL_MS poll for lines from the server reader and worker threads.
+        """
+        self._log_queue.put(message)
+        if not self._log_flush_pending and threading.current_thread() is threading.main_thread():
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Write all queued log lines to the console at once (Tk thread only)."""
+        self._log_flush_pending = False
+        if self.log_text is None:
+            return  # Console not built yet; setup_ui_deferred flushes the backlog
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+
+            # Keep the console bounded over long sessions: trim the oldest lines in one go
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{line_count - LOG_KEEP_LINES}.0")
+
+            self.log_text.see(tk.END)
+
+    def _poll_log_queue(self):
+        """Periodically flush lines queued by background threads."""
+        self._flush_log()
+        self.root.after(LOG_POLL_MS, self._poll_log_queue)
+
+    def _get_http(self):
+        """
+        Get the shared requests session, creating it on first network use.
+
+        requests (with urllib3/certifi) is imported here rather than at startup,
+        so the window appears sooner.
+        """
+        with self._http_lock:
+            if self._http is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self._http = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                self._http.mount("http://", adapter)
+                self._http.mount("https://", adapter)
+            return self._http
+
+    def _post(self, func, *args):
+        """Run func(*args) on the Tk main thread (for use from worker threads)."""
+        self.root.after(0, func, *args)
+
+    def _set_status(self, text, color):
+        """Update the status indicator in the title bar."""
+        self.status_label.config(text=text, foreground=color)
+
+    def _run_in_background(self, target):
+        """
+        Run a long task (pip/npm installs) on a worker thread so the window keeps
+        repainting and responding instead of showing "Not Responding".
+        The buttons that would start a second install are disabled until it finishes.
+        """
+        self.setup_running = True
+        self.start_button.config(state="disabled")
+        self.deps_button.config(state="disabled")
+
+        def run():
+            try:
+                target()
+            finally:
+                self._post(self._background_task_done)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _run_streaming(self, cmd, cwd):
+        """
+        Run an install command (or git pull), logging its output line by line as it arrives.
+
+        Returns (returncode, output tail): only the last INSTALL_OUTPUT_TAIL lines
+        are kept for the error dialog instead of the whole pip/npm log.
+        """
+        output = deque(maxlen=INSTALL_OUTPUT_TAIL)
+        process = subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1
+        )
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                output.append(line)
+                self.log(f"  {line}")
+        return process.wait(), "\n".join(output)
+
+    def _background_task_done(self):
+        """Re-enable the buttons disabled by _run_in_background."""
+        self.setup_running = False
+        if not self.backend_process:
+            self.start_button.config(state="normal")
+        self.deps_button.config(state="normal")
 
     def clear_console(self):
         """Clear the console/log output."""
+        self._flush_log()
         self.log_text.delete(1.0, tk.END)
         self.log("Console cleared")
 
     def auto_detect_url(self):
-        """Auto-detect Plex server URL."""
+        """Auto-detect Plex server URL (probes run in the background)."""
         self.log("Detecting Plex server...")
+        self.detect_button.config(state="disabled")
+        threading.Thread(target=self._auto_detect_url_worker, daemon=True).start()
 
+    def _auto_detect_url_worker(self):
+        """Probe common local URLs at once and report the first that answers (worker thread)."""
         # Try common local URLs
         common_urls = [
             "http://localhost:32400",
             "http://127.0.0.1:32400"
         ]
 
-        for url in common_urls:
-            try:
-                response = requests.get(f"{url}/identity", timeout=2)
-                if response.status_code == 200:
-                    self.url_var.set(url)
-                    self.log(f"✓ Found Plex server at: {url}")
-                    messagebox.showinfo("Success", f"Found Plex server at:\n{url}")
+        http = self._get_http()
+
+        def probe(url):
+            return http.get(f"{url}/identity", timeout=2).status_code == 200
+
+        # Concurrent probes: a dead address costs one timeout in total, not one each
+        pool = ThreadPoolExecutor(max_workers=len(common_urls))
+        futures = {pool.submit(probe, url): url for url in common_urls}
+        try:
+            for future in as_completed(futures):
+                try:
+                    found = future.result()
+                except Exception:
+                    continue
+                if found:
+                    self._post(self._on_url_detected, futures[future])
                     return
-            except:
-                continue
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        self._post(self._on_url_detected, None)
+
+    def _on_url_detected(self, url):
+        """Show the auto-detect result (Tk thread)."""
+        self.detect_button.config(state="normal")
+
+        if url:
+            self.url_var.set(url)
+            self.log(f"✓ Found Plex server at: {url}")
+            messagebox.showinfo("Success", f"Found Plex server at:\n{url}")
+            return
 
         self.log("✗ Could not auto-detect Plex server.")
         messagebox.showwarning("Auto-Detect",
@@ -283,43 +620,65 @@ class PlexPosterManagerLauncher:
             self.token_entry.config(show="*")
 
     def test_token(self):
-        """Test Plex token validity using PlexAPI."""
+        """Test Plex token validity using PlexAPI (connection runs in the background)."""
         token = self.token_var.get().strip()
         if not token:
             messagebox.showwarning("No Token", "Please enter a Plex token to test.")
             return
 
+        plex_url = self.url_var.get().strip() or "http://localhost:32400"
         self.log("Testing Plex token...")
 
+        # A token that just passed doesn't need another round trip to Plex
+        cached = self._token_cache.get((plex_url, token))
+        if cached and time.monotonic() - cached[2] < TOKEN_TEST_TTL:
+            self._on_token_tested(plex_url, cached[0], cached[1], None)
+            return
+
+        self.test_button.config(state="disabled")
+        threading.Thread(target=self._test_token_worker, args=(plex_url, token), daemon=True).start()
+
+    def _test_token_worker(self, plex_url, token):
+        """Connect to Plex with the token (worker thread)."""
         try:
             # Test by trying to connect to Plex server
             from plexapi.server import PlexServer
 
-            plex_url = self.url_var.get().strip() or "http://localhost:32400"
-            plex = PlexServer(plex_url, token)
+            # Share the launcher's session so repeat tests reuse the open connection
+            plex = PlexServer(plex_url, token, session=self._get_http())
 
             # If we got here, connection worked!
-            self.log(f"✓ Token valid! Connected to: {plex.friendlyName}")
-            self.log(f"  Server version: {plex.version}")
+            self._token_cache[(plex_url, token)] = (plex.friendlyName, plex.version, time.monotonic())
+            self._post(self._on_token_tested, plex_url, plex.friendlyName, plex.version, None)
+        except Exception as e:
+            self._post(self._on_token_tested, plex_url, None, None, str(e))
+
+    def _on_token_tested(self, plex_url, friendly_name, version, error_msg):
+        """Report a token test result (Tk thread)."""
+        self.test_button.config(state="normal")
+
+        if error_msg is None:
+            self.log(f"✓ Token valid! Connected to: {friendly_name}")
+            self.log(f"  Server version: {version}")
             messagebox.showinfo("Success",
                               f"Token is valid!\n\n"
-                              f"Connected to: {plex.friendlyName}\n"
-                              f"Version: {plex.version}")
-        except Exception as e:
-            error_msg = str(e)
-            self.log(f"✗ Token test failed: {error_msg}")
-
-            if "401" in error_msg or "Unauthorized" in error_msg:
-                messagebox.showerror("Invalid Token",
-                                    "Token is invalid or expired.\n\n"
-                                    "Please get a new token from:\n"
-                                    "https://support.plex.tv/articles/204059436")
-            elif "Connection" in error_msg or "timeout" in error_msg.lower():
-                messagebox.showerror("Connection Failed",
-                                    f"Could not connect to Plex server at:\n{plex_url}\n\n"
-                                    "Make sure Plex Media Server is running.")
-            else:
-                messagebox.showerror("Error", f"Token test failed:\n\n{error_msg}")
+                              f"Connected to: {friendly_name}\n"
+                              f"Version: {version}")
+            return
+
+        self.log(f"✗ Token test failed: {error_msg}")
+
+        if "401" in error_msg or "Unauthorized" in error_msg:
+            messagebox.showerror("Invalid Token",
+                                "Token is invalid or expired.\n\n"
+                                "Please get a new token from:\n"
+                                "https://support.plex.tv/articles/204059436")
+        elif "Connection" in error_msg or "timeout" in error_msg.lower():
+            messagebox.showerror("Connection Failed",
+                                f"Could not connect to Plex server at:\n{plex_url}\n\n"
+                                "Make sure Plex Media Server is running.")
+        else:
+            messagebox.showerror("Error", f"Token test failed:\n\n{error_msg}")
 
     def save_configuration(self):
         """Save current configuration."""
@@ -340,38 +699,58 @@ class PlexPosterManagerLauncher:
 
     def check_dependencies(self):
         """Check if dependencies are installed, offer to install if missing."""
+        if self.setup_running:
+            self.log("ℹ Dependency installation still in progress...")
+            return False
+        if self._deps_ok:
+            return True
+
         self.log("Checking dependencies...")
+        return self._apply_dependency_check(*self._scan_dependencies())
 
+    def _check_dependencies_in_background(self):
+        """
+        Startup dependency check: the filesystem checks run on a worker thread so
+        a cold disk can't hold up the first paint; any prompt is shown on the Tk thread.
+        """
+        self.log("Checking dependencies...")
+
+        def run():
+            self._post(self._apply_dependency_check, *self._scan_dependencies())
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _scan_dependencies(self):
+        """Look for missing/outdated dependencies on disk (any thread, no dialogs)."""
         needs_setup = []
         needs_update = []
+        # Each path is stat'ed once per scan, shared with the package.json check
+        stat = functools.lru_cache(maxsize=None)(_stat_or_none)
 
         # Check Python venv
-        if not VENV_PYTHON.exists():
+        if stat(VENV_PYTHON) is None:
             self.log("✗ Python virtual environment not found!")
             needs_setup.append("Backend virtual environment")
 
         # Check node_modules
-        if not (FRONTEND_DIR / "node_modules").exists():
+        if stat(FRONTEND_NODE_MODULES) is None:
             self.log("✗ Frontend dependencies not installed!")
             needs_setup.append("Frontend dependencies")
         else:
             # Check if package.json has newer dependencies than what's installed
             # This catches cases like lucide-react being added after npm install
-            package_json = FRONTEND_DIR / "package.json"
-            if package_json.exists():
+            if stat(FRONTEND_PKG_JSON) is not None:
                 try:
-                    import json
-                    with open(package_json, 'r') as f:
-                        pkg_data = json.load(f)
-
-                    # Check if lucide-react (new in v2.1.0) is installed
-                    lucide_path = FRONTEND_DIR / "node_modules" / "lucide-react"
-                    if "lucide-react" in pkg_data.get("dependencies", {}) and not lucide_path.exists():
+                    if self._new_packages_missing(stat):
                         self.log("⚠ New dependencies detected (lucide-react icons)")
                         needs_update.append("Frontend dependencies (new packages)")
                 except Exception as e:
                     self.log(f"  (Could not check package.json: {e})")
 
+        return needs_setup, needs_update
+
+    def _apply_dependency_check(self, needs_setup, needs_update):
+        """Show a dependency check result, offering to install what's missing (Tk thread)."""
         if needs_setup:
             self.status_label.config(text="● Missing Dependencies", foreground="red")
 
@@ -409,72 +788,95 @@ class PlexPosterManagerLauncher:
                 return False
 
         self.log("✓ All dependencies found and up to date")
+        self._deps_ok = True
         return True
 
+    def _new_packages_missing(self, stat=_stat_or_none):
+        """
+        Check if lucide-react (new in v2.1.0) is in package.json but not installed.
+
+        The answer only changes when package.json or node_modules changes, so it is
+        cached by their mtimes (in DEP_CACHE_FILE, so it survives restarts) and
+        package.json is only parsed again after one of them changes. `stat` lets
+        the caller share stat results it already has.
+        """
+        key = [stat(FRONTEND_PKG_JSON).st_mtime_ns, stat(FRONTEND_NODE_MODULES).st_mtime_ns]
+
+        if self._dep_cache is None:
+            try:
+                with open(DEP_CACHE_FILE, 'r') as f:
+                    self._dep_cache = json.load(f)
+            except (OSError, ValueError):
+                self._dep_cache = {}
+        if self._dep_cache.get("key") == key:
+            return self._dep_cache["missing"]
+
+        with open(FRONTEND_PKG_JSON, 'r') as f:
+            pkg_data = json.load(f)
+        missing = ("lucide-react" in pkg_data.get("dependencies", {})
+                   and stat(FRONTEND_LUCIDE) is None)
+
+        self._dep_cache = {"key": key, "missing": missing}
+        try:
+            with open(DEP_CACHE_FILE, 'w') as f:
+                json.dump(self._dep_cache, f)
+        except OSError:
+            pass  # Cache is only an optimization
+        return missing
+
     def run_first_time_setup(self):
-        """Run automated first-time setup."""
+        """
+        Run automated first-time setup in the background.
+
+        Returns False: the servers can be launched once setup reports completion.
+        """
         self.log("\n" + "=" * 60)
         self.log("FIRST TIME SETUP - This may take a few minutes")
         self.log("=" * 60)
 
+        self._run_in_background(self._first_time_setup_worker)
+        return False
+
+    def _first_time_setup_worker(self):
+        """Create the venv and install backend/frontend dependencies (worker thread)."""
         try:
             # Create venv if needed
             if not VENV_PYTHON.exists():
                 self.log("\n📦 Creating Python virtual environment...")
-                self.status_label.config(text="● Setting up backend...", foreground="orange")
+                self._post(self._set_status, "● Setting up backend...", "orange")
 
-                result = subprocess.run(
-                    [sys.executable, "-m", "venv", "venv"],
-                    cwd=str(BACKEND_DIR),
-                    capture_output=True,
-                    text=True
-                )
+                returncode, output = self._run_streaming([sys.executable, "-m", "venv", "venv"], BACKEND_DIR)
 
-                if result.returncode != 0:
-                    self.log(f"✗ Failed to create venv: {result.stderr}")
-                    messagebox.showerror("Setup Failed", f"Failed to create virtual environment:\n{result.stderr}")
-                    return False
+                if returncode != 0:
+                    self.log("✗ Failed to create venv")
+                    self._post(messagebox.showerror, "Setup Failed", f"Failed to create virtual environment:\n{output}")
+                    return
 
                 self.log("✓ Virtual environment created")
 
                 # Install Python dependencies
                 self.log("\n📦 Installing backend dependencies...")
 
-                if platform.system() == "Windows":
-                    pip_exe = BACKEND_DIR / "venv" / "Scripts" / "pip.exe"
-                else:
-                    pip_exe = BACKEND_DIR / "venv" / "bin" / "pip"
-
-                result = subprocess.run(
-                    [str(pip_exe), "install", "-r", "requirements.txt"],
-                    cwd=str(BACKEND_DIR),
-                    capture_output=True,
-                    text=True
-                )
+                returncode, output = self._run_streaming([str(BACKEND_PIP), "install", "-r", "requirements.txt"], BACKEND_DIR)
 
-                if result.returncode != 0:
-                    self.log(f"✗ Failed to install backend dependencies: {result.stderr}")
-                    messagebox.showerror("Setup Failed", f"Failed to install backend dependencies:\n{result.stderr}")
-                    return False
+                if returncode != 0:
+                    self.log("✗ Failed to install backend dependencies")
+                    self._post(messagebox.showerror, "Setup Failed", f"Failed to install backend dependencies:\n{output}")
+                    return
 
                 self.log("✓ Backend dependencies installed")
 
             # Install Node dependencies if needed
-            if not (FRONTEND_DIR / "node_modules").exists():
+            if not FRONTEND_NODE_MODULES.exists():
                 self.log("\n📦 Installing frontend dependencies (this takes longest)...")
-                self.status_label.config(text="● Setting up frontend...", foreground="orange")
+                self._post(self._set_status, "● Setting up frontend...", "orange")
 
-                result = subprocess.run(
-                    [NPM_CMD, "install"],
-                    cwd=str(FRONTEND_DIR),
-                    capture_output=True,
-                    text=True
-                )
+                returncode, output = self._run_streaming([NPM_CMD, "install"], FRONTEND_DIR)
 
-                if result.returncode != 0:
-                    self.log(f"✗ Failed to install frontend dependencies: {result.stderr}")
-                    messagebox.showerror("Setup Failed", f"Failed to install frontend dependencies:\n{result.stderr}")
-                    return False
+                if returncode != 0:
+                    self.log("✗ Failed to install frontend dependencies")
+                    self._post(messagebox.showerror, "Setup Failed", f"Failed to install frontend dependencies:\n{output}")
+                    return
 
                 self.log("✓ Frontend dependencies installed")
 
@@ -482,64 +884,65 @@ class PlexPosterManagerLauncher:
             self.log("✓ SETUP COMPLETE! You can now launch the servers.")
             self.log("=" * 60 + "\n")
 
-            self.status_label.config(text="● Ready", foreground="green")
-            messagebox.showinfo("Setup Complete",
-                               "All dependencies installed successfully!\n\n"
-                               "You can now click 'Launch Servers' to start.")
-            return True
+            self._post(self._set_status, "● Ready", "green")
+            self._post(messagebox.showinfo, "Setup Complete",
+                       "All dependencies installed successfully!\n\n"
+                       "You can now click 'Launch Servers' to start.")
 
         except Exception as e:
             self.log(f"\n✗ Setup failed with error: {e}")
-            messagebox.showerror("Setup Failed", f"An error occurred during setup:\n{e}")
-            self.status_label.config(text="● Setup Failed", foreground="red")
-            return False
+            self._post(messagebox.showerror, "Setup Failed", f"An error occurred during setup:\n{e}")
+            self._post(self._set_status, "● Setup Failed", "red")
 
     def update_frontend_dependencies(self):
-        """Update frontend dependencies (run npm install)."""
+        """
+        Update frontend dependencies (run npm install) in the background.
+
+        Returns False: the servers can be launched once the install reports completion.
+        """
         self.log("\n" + "=" * 60)
         self.log("UPDATING FRONTEND DEPENDENCIES")
         self.log("=" * 60)
         self.log("\n📦 Installing new packages from package.json...")
-        self.status_label.config(text="● Installing packages...", foreground="orange")
+        self._set_status("● Installing packages...", "orange")
 
+        self._run_in_background(self._update_frontend_dependencies_worker)
+        return False
+
+    def _update_frontend_dependencies_worker(self):
+        """Run npm install for new frontend packages (worker thread)."""
         try:
-            result = subprocess.run(
-                [NPM_CMD, "install"],
-                cwd=str(FRONTEND_DIR),
-                capture_output=True,
-                text=True
-            )
+            returncode, output = self._run_streaming([NPM_CMD, "install"], FRONTEND_DIR)
 
-            if result.returncode != 0:
-                self.log(f"✗ Failed to install dependencies: {result.stderr}")
-                messagebox.showerror("Update Failed",
-                                   f"Failed to install dependencies:\n\n{result.stderr}")
-                self.status_label.config(text="● Update Failed", foreground="red")
-                return False
+            if returncode != 0:
+                self.log("✗ Failed to install dependencies")
+                self._post(messagebox.showerror, "Update Failed",
+                           f"Failed to install dependencies:\n\n{output}")
+                self._post(self._set_status, "● Update Failed", "red")
+                return
 
             self.log("✓ Frontend dependencies updated successfully")
             self.log("\n" + "=" * 60)
             self.log("✓ UPDATE COMPLETE!")
             self.log("=" * 60 + "\n")
 
-            self.status_label.config(text="● Ready", foreground="green")
-            messagebox.showinfo("Success",
-                              "Dependencies installed successfully!\n\n"
-                              "If servers are running, please restart them\n"
-                              "to use the new packages.")
-            return True
+            self._post(self._set_status, "● Ready", "green")
+            self._post(messagebox.showinfo, "Success",
+                       "Dependencies installed successfully!\n\n"
+                       "If servers are running, please restart them\n"
+                       "to use the new packages.")
 
         except Exception as e:
             self.log(f"✗ Error updating dependencies: {e}")
-            messagebox.showerror("Error", f"Failed to update dependencies:\n\n{e}")
-            self.status_label.config(text="● Update Failed", foreground="red")
-            return False
+            self._post(messagebox.showerror, "Error", f"Failed to update dependencies:\n\n{e}")
+            self._post(self._set_status, "● Update Failed", "red")
 
     def start_servers(self):
         """Start both backend and frontend servers."""
         if not self.check_dependencies():
-            messagebox.showerror("Missing Dependencies",
-                                 "Please install dependencies first.\nSee log for details.")
+            if not self.setup_running:
+                messagebox.showerror("Missing Dependencies",
+                                     "Please install dependencies first.\nSee log for details.")
             return
 
         self.log("=" * 60)
@@ -555,22 +958,63 @@ class PlexPosterManagerLauncher:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                bufsize=0  # Unbuffered
+                bufsize=0,  # Unbuffered
+                **PROCESS_CONTROL.popen_kwargs()
             )
             self.backend_status.config(text="Backend: Running", foreground="green")
             self.log("✓ Backend started")
 
-            # Start reading backend output in thread
-            threading.Thread(target=self.read_backend_output, daemon=True).start()
+            # Start forwarding backend output to the log
+            self._watch_output(self.backend_process, "Backend")
         except Exception as e:
             self.log(f"✗ Failed to start backend: {e}")
             messagebox.showerror("Error", f"Failed to start backend:\n{e}")
             return
 
-        # Wait a bit for backend to initialize
-        time.sleep(2)
+        self.start_button.config(state="disabled")
+        self.stop_button.config(state="normal")
+        self.status_label.config(text="● Starting...", foreground="orange")
+
+        # Start the frontend as soon as the backend answers, without blocking the UI
+        self.log("[Backend] Waiting for server to respond...")
+        threading.Thread(target=self._await_backend_ready,
+                         args=(self.backend_process,), daemon=True).start()
+
+    def _await_backend_ready(self, process):
+        """Poll the backend health check until it answers or exits (worker thread)."""
+        http = self._get_http()
+        deadline = time.monotonic() + BACKEND_READY_TIMEOUT
+        ready = False
+        while process.poll() is None and time.monotonic() < deadline:
+            try:
+                if http.get(BACKEND_HEALTH_URL, timeout=1).status_code == 200:
+                    ready = True
+                    break
+            except Exception:
+                pass  # Not listening yet
+            time.sleep(BACKEND_READY_POLL)
+        self._post(self._on_backend_ready, process, ready)
+
+    def _on_backend_ready(self, process, ready):
+        """Continue start-up once the backend is up (Tk thread)."""
+        if process is not self.backend_process:
+            return  # Servers were stopped while waiting
+
+        if process.poll() is not None:
+            self.log(f"✗ Backend exited during start-up (code {process.returncode})")
+            messagebox.showerror("Error", "Backend exited during start-up.\nSee log for details.")
+            self.stop_servers()
+            return
+
+        if ready:
+            self.log("✓ Backend is responding")
+        else:
+            self.log(f"⚠ Backend not responding after {BACKEND_READY_TIMEOUT}s, starting frontend anyway")
+
+        self._start_frontend()
 
-        # Start frontend
+    def _start_frontend(self):
+        """Start the frontend dev server and finish start-up."""
         self.log("\n[Frontend] Starting React dev server...")
         try:
             env = os.environ.copy()
@@ -583,13 +1027,14 @@ class PlexPosterManagerLauncher:
                 stderr=subprocess.STDOUT,
                 text=True,
                 bufsize=0,  # Unbuffered
-                env=env
+                env=env,
+                **PROCESS_CONTROL.popen_kwargs()
             )
             self.frontend_status.config(text="Frontend: Running", foreground="green")
             self.log("✓ Frontend started")
 
-            # Start reading frontend output in thread
-            threading.Thread(target=self.read_frontend_output, daemon=True).start()
+            # Start forwarding frontend output to the log
+            self._watch_output(self.frontend_process, "Frontend")
         except Exception as e:
             self.log(f"✗ Failed to start frontend: {e}")
             messagebox.showerror("Error", f"Failed to start frontend:\n{e}")
@@ -597,8 +1042,6 @@ class PlexPosterManagerLauncher:
             return
 
         # Update UI
-        self.start_button.config(state="disabled")
-        self.stop_button.config(state="normal")
         self.browser_button.config(state="normal")
         self.status_label.config(text="● Running", foreground="green")
 
@@ -611,60 +1054,123 @@ class PlexPosterManagerLauncher:
         # Auto-open browser after a delay
         self.root.after(5000, self.open_browser)
 
-    def read_backend_output(self):
-        """Read backend process output."""
-        try:
-            for line in iter(self.backend_process.stdout.readline, ''):
-                if line:
-                    self.log(f"[Backend] {line.rstrip()}")
-        except Exception as e:
-            self.log(f"[Backend] Output stream closed: {e}")
+    def _watch_output(self, process, label):
+        """
+        Forward a server's output to the log.
+
+        On macOS/Linux a single selector thread waits on every server pipe at once.
+        Windows can't select() on pipes, so there each pipe gets its own
+        _read_output thread instead. Either way output is read in blocks of up
+        to OUTPUT_READ_SIZE bytes and split into lines here.
+        """
+        if not PROCESS_CONTROL.select_pipes:
+            threading.Thread(target=self._read_output, args=(process, label), daemon=True).start()
+            return
 
-    def read_frontend_output(self):
-        """Read frontend process output."""
-        try:
-            for line in iter(self.frontend_process.stdout.readline, ''):
-                if line:
-                    # Filter out some verbose npm output
-                    line_clean = line.rstrip()
-                    if line_clean and not line_clean.startswith("webpack"):
-                        self.log(f"[Frontend] {line_clean}")
-        except Exception as e:
-            self.log(f"[Frontend] Output stream closed: {e}")
+        with self._reader_lock:
+            try:
+                self._output_selector.register(process.stdout, selectors.EVENT_READ, label)
+            except KeyError:
+                # fd number reused from a stopped server whose pipe was never drained
+                self._output_selector.unregister(process.stdout.fileno())
+                self._output_selector.register(process.stdout, selectors.EVENT_READ, label)
+            if self._reader_thread is None:
+                self._reader_thread = threading.Thread(target=self._select_output, daemon=True)
+                self._reader_thread.start()
+
+    def _select_output(self):
+        """Forward output from all registered server pipes (selector thread)."""
+        selector = self._output_selector
+        partial = {}  # fd -> bytes after the last newline
+        while True:
+            with self._reader_lock:
+                if not selector.get_map():
+                    self._reader_thread = None
+                    return
+
+            for key, _ in selector.select(timeout=0.5):
+                try:
+                    data = os.read(key.fd, OUTPUT_READ_SIZE)
+                except OSError:
+                    data = b""
+                partial[key.fd] = self._log_server_output(key.data, partial.pop(key.fd, b""), data)
+                if not data:
+                    # EOF: the server exited
+                    del partial[key.fd]
+                    with self._reader_lock:
+                        selector.unregister(key.fileobj)
+
+    def _read_output(self, process, label):
+        """Forward one server pipe's output to the log (Windows, see _watch_output)."""
+        fd = process.stdout.fileno()
+        partial = b""
+        while True:
+            try:
+                data = os.read(fd, OUTPUT_READ_SIZE)
+            except OSError as e:
+                self.log(f"[{label}] Output stream closed: {e}")
+                data = b""
+            partial = self._log_server_output(label, partial, data)
+            if not data:
+                return
+
+    def _log_server_output(self, label, partial, data):
+        """
+        Log the complete lines in a block of server output.
+
+        `partial` is the unfinished line left over from the previous block; the new
+        unfinished line is returned. Empty `data` means EOF and flushes it.
+        """
+        pending = partial + data
+        if data:
+            *lines, partial = pending.split(b"\n")
+        else:
+            lines, partial = ([pending] if pending else []), b""
+        for line in lines:
+            self._log_server_line(label, line.decode("utf-8", "replace"))
+        return partial
+
+    def _log_server_line(self, label, line):
+        """Log one line of server output."""
+        line = line.rstrip()
+        # Filter out some verbose npm output
+        if label == "Frontend" and (not line or line.startswith(FRONTEND_NOISE_PREFIXES)):
+            return
+        self.log(f"[{label}] {line}")
 
     def stop_servers(self):
         """Stop both servers."""
         self.log("\nStopping servers...")
 
-        # Stop frontend
-        if self.frontend_process:
-            try:
-                self.log("[Frontend] Stopping...")
-                if platform.system() == "Windows":
-                    self.frontend_process.terminate()
-                else:
-                    os.killpg(os.getpgid(self.frontend_process.pid), signal.SIGTERM)
-                self.frontend_process.wait(timeout=5)
-                self.frontend_status.config(text="Frontend: Stopped", foreground="gray")
-                self.log("✓ Frontend stopped")
-            except Exception as e:
-                self.log(f"✗ Error stopping frontend: {e}")
-            self.frontend_process = None
+        # Signal both servers first, then wait for them together: stopping takes
+        # as long as the slower one, not both in turn
+        stopping = []
+        for label, process, status in (("Frontend", self.frontend_process, self.frontend_status),
+                                       ("Backend", self.backend_process, self.backend_status)):
+            if process:
+                try:
+                    self.log(f"[{label}] Stopping...")
+                    PROCESS_CONTROL.terminate(process)
+                    stopping.append((label, process, status))
+                except Exception as e:
+                    self.log(f"✗ Error stopping {label.lower()}: {e}")
 
-        # Stop backend
-        if self.backend_process:
+        deadline = time.monotonic() + SERVER_STOP_TIMEOUT
+        for label, process, status in stopping:
             try:
-                self.log("[Backend] Stopping...")
-                if platform.system() == "Windows":
-                    self.backend_process.terminate()
-                else:
-                    os.killpg(os.getpgid(self.backend_process.pid), signal.SIGTERM)
-                self.backend_process.wait(timeout=5)
-                self.backend_status.config(text="Backend: Stopped", foreground="gray")
-                self.log("✓ Backend stopped")
+                try:
+                    PROCESS_CONTROL.wait(process, max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    self.log(f"[{label}] Not responding, killing...")
+                    PROCESS_CONTROL.kill(process)
+                    PROCESS_CONTROL.wait(process, SERVER_KILL_TIMEOUT)
+                status.config(text=f"{label}: Stopped", foreground="gray")
+                self.log(f"✓ {label} stopped")
             except Exception as e:
-                self.log(f"✗ Error stopping backend: {e}")
-            self.backend_process = None
+                self.log(f"✗ Error stopping {label.lower()}: {e}")
+
+        self.frontend_process = None
+        self.backend_process = None
 
         # Update UI
         self.start_button.config(state="normal")
@@ -676,7 +1182,7 @@ class PlexPosterManagerLauncher:
 
     def open_browser(self):
         """Open the app in default browser."""
-        webbrowser.open("http://localhost:3000")
+        _open_url("http://localhost:3000")
         self.log("✓ Opened browser to http://localhost:3000")
 
     def auto_start(self):
@@ -700,27 +1206,22 @@ class PlexPosterManagerLauncher:
             self.log("ℹ Update cancelled")
             return
 
+        self._run_in_background(self._update_dependencies_worker)
+
+    def _update_dependencies_worker(self):
+        """Run pip install and npm install (worker thread)."""
         try:
             # Update backend dependencies
             self.log("\n📦 Updating backend dependencies...")
 
-            if platform.system() == "Windows":
-                pip_exe = BACKEND_DIR / "venv" / "Scripts" / "pip.exe"
-            else:
-                pip_exe = BACKEND_DIR / "venv" / "bin" / "pip"
+            returncode, output = self._run_streaming([str(BACKEND_PIP), "install", "-r", "requirements.txt"], BACKEND_DIR)
 
-            result = subprocess.run(
-                [str(pip_exe), "install", "-r", "requirements.txt"],
-                cwd=str(BACKEND_DIR),
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                self.log(f"✗ Backend update failed: {result.stderr}")
-                messagebox.showerror(
+            if returncode != 0:
+                self.log("✗ Backend update failed")
+                self._post(
+                    messagebox.showerror,
                     "Update Failed",
-                    f"Failed to update backend dependencies:\n\n{result.stderr}"
+                    f"Failed to update backend dependencies:\n\n{output}"
                 )
                 return
 
@@ -729,25 +1230,22 @@ class PlexPosterManagerLauncher:
             # Update frontend dependencies
             self.log("\n📦 Updating frontend dependencies...")
 
-            result = subprocess.run(
-                [NPM_CMD, "install"],
-                cwd=str(FRONTEND_DIR),
-                capture_output=True,
-                text=True
-            )
+            returncode, output = self._run_streaming([NPM_CMD, "install"], FRONTEND_DIR)
 
-            if result.returncode != 0:
-                self.log(f"✗ Frontend update failed: {result.stderr}")
-                messagebox.showerror(
+            if returncode != 0:
+                self.log("✗ Frontend update failed")
+                self._post(
+                    messagebox.showerror,
                     "Update Failed",
-                    f"Failed to update frontend dependencies:\n\n{result.stderr}"
+                    f"Failed to update frontend dependencies:\n\n{output}"
                 )
                 return
 
             self.log("✓ Frontend dependencies updated")
 
             self.log("\n✓ All dependencies updated successfully!")
-            messagebox.showinfo(
+            self._post(
+                messagebox.showinfo,
                 "Update Complete",
                 "All dependencies have been updated!\n\n"
                 "You can now restart the servers if they were running."
@@ -755,16 +1253,29 @@ class PlexPosterManagerLauncher:
 
         except Exception as e:
             self.log(f"\n✗ Update failed: {e}")
-            messagebox.showerror("Update Failed", f"An error occurred:\n\n{str(e)}")
+            self._post(messagebox.showerror, "Update Failed", f"An error occurred:\n\n{str(e)}")
 
     def check_for_updates(self):
         """Check GitHub for latest release and offer to update."""
         self.log("\n🔍 Checking for updates...")
 
+        # Repeat clicks shortly after a check reuse its result
+        if self._update_cache and time.monotonic() - self._update_cache[0] < UPDATE_CHECK_TTL:
+            self._show_update_result(*self._update_cache[1])
+            return
+
+        self.update_button.config(state="disabled")
+        threading.Thread(target=self._check_for_updates_worker, daemon=True).start()
+
+    def _check_for_updates_worker(self):
+        """Fetch the latest release and the local git version (worker thread)."""
+        http = self._get_http()
+        import requests
+
         try:
             # Fetch latest release from GitHub API
             url = "https://api.github.com/repos/ButtaJones/plex-poster-manager/releases/latest"
-            response = requests.get(url, timeout=10)
+            response = http.get(url, timeout=10)
             response.raise_for_status()
 
             latest_release = response.json()
@@ -774,48 +1285,69 @@ class PlexPosterManagerLauncher:
             release_url = latest_release.get('html_url', '')
 
             # Get current version from git (if available)
+            # (a tag is plain ASCII, so skip text-mode decoding; stderr is unused)
             try:
                 current_version_result = subprocess.run(
                     ["git", "describe", "--tags", "--abbrev=0"],
                     cwd=str(PROJECT_ROOT),
-                    capture_output=True,
-                    text=True
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
                 )
-                current_version = current_version_result.stdout.strip() if current_version_result.returncode == 0 else "unknown"
-            except:
+                current_version = "unknown"
+                if current_version_result.returncode == 0:
+                    current_version = current_version_result.stdout.strip().decode("ascii", "replace") or "unknown"
+            except (OSError, subprocess.SubprocessError):
                 current_version = "unknown"
 
-            self.log(f"✓ Current version: {current_version}")
-            self.log(f"✓ Latest version: {latest_version}")
-
-            # Check if update is available
-            if current_version == latest_version:
-                self.log("✓ You're up to date!")
-                messagebox.showinfo(
-                    "No Updates Available",
-                    f"You're already running the latest version!\n\n"
-                    f"Current: {current_version}\n"
-                    f"Latest: {latest_version}"
-                )
-            else:
-                # Show update dialog with changelog
-                self.show_update_dialog(current_version, latest_version, release_name, release_body, release_url)
+            self._post(self._on_update_check_done,
+                       (current_version, latest_version, release_name, release_body, release_url))
 
         except requests.exceptions.RequestException as e:
             self.log(f"✗ Failed to check for updates: {e}")
-            messagebox.showerror(
+            self._post(
+                messagebox.showerror,
                 "Update Check Failed",
                 f"Could not check for updates:\n\n{str(e)}\n\n"
                 "Please check your internet connection or try again later."
             )
         except Exception as e:
             self.log(f"✗ Error checking for updates: {e}")
-            messagebox.showerror("Error", f"An error occurred:\n\n{str(e)}")
+            self._post(messagebox.showerror, "Error", f"An error occurred:\n\n{str(e)}")
+        finally:
+            self._post(self._update_check_finished)
+
+    def _update_check_finished(self):
+        """Re-enable the update button once a background check ends (Tk thread)."""
+        self.update_button.config(state="normal")
+
+    def _on_update_check_done(self, result):
+        """Cache and show a completed update check (Tk thread)."""
+        self._update_cache = (time.monotonic(), result)
+        self._show_update_result(*result)
+
+    def _show_update_result(self, current_version, latest_version, release_name, release_body, release_url):
+        """Report the current vs. latest version, offering the update if there is one."""
+        self.log(f"✓ Current version: {current_version}")
+        self.log(f"✓ Latest version: {latest_version}")
+
+        # Check if update is available
+        if current_version == latest_version:
+            self.log("✓ You're up to date!")
+            messagebox.showinfo(
+                "No Updates Available",
+                f"You're already running the latest version!\n\n"
+                f"Current: {current_version}\n"
+                f"Latest: {latest_version}"
+            )
+        else:
+            # Show update dialog with changelog
+            self.show_update_dialog(current_version, latest_version, release_name, release_body, release_url)
 
     def show_update_dialog(self, current, latest, name, changelog, url):
         """Show update available dialog with changelog."""
         # Create custom dialog
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()  # Build it hidden and show it once, fully laid out
         dialog.title("Update Available")
         dialog.geometry("600x500")
         dialog.resizable(True, True)
@@ -833,7 +1365,7 @@ class PlexPosterManagerLauncher:
 
         changelog_text = scrolledtext.ScrolledText(changelog_frame, wrap=tk.WORD, height=15)
         changelog_text.pack(fill="both", expand=True)
-        changelog_text.insert(1.0, changelog)
+        changelog_text.insert(tk.END, changelog)
         changelog_text.config(state="disabled")
 
         # Buttons frame
@@ -861,60 +1393,80 @@ class PlexPosterManagerLauncher:
         later_btn = ttk.Button(button_frame, text="Remind Me Later", command=remind_later)
         later_btn.pack(side="left", padx=5)
 
-        # Center dialog
+        # Lay it out while still hidden, center it over the launcher window, then show it
+        # (it must be mapped before grab_set)
+        dialog.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - 600) // 2
+        y = self.root.winfo_rooty() + (self.root.winfo_height() - 500) // 2
+        dialog.geometry(f"600x500+{max(x, 0)}+{max(y, 0)}")
+        dialog.deiconify()
         dialog.transient(self.root)
         dialog.grab_set()
 
     def perform_update(self, release_url):
         """Perform git pull to update the application."""
         self.log("\n📥 Updating application...")
+        self.update_button.config(state="disabled")
+        threading.Thread(target=self._perform_update_worker, args=(release_url,), daemon=True).start()
 
+    def _perform_update_worker(self, release_url):
+        """Run git pull, streaming its output to the log (worker thread)."""
         try:
-            # Check if git is available
-            result = subprocess.run(
-                ["git", "pull"],
-                cwd=str(PROJECT_ROOT),
-                capture_output=True,
-                text=True
-            )
+            returncode, output = self._run_streaming(["git", "pull"], PROJECT_ROOT)
+        except Exception as e:
+            self._post(self._on_update_performed, release_url, None, str(e))
+        else:
+            self._post(self._on_update_performed, release_url, returncode, output)
 
-            if result.returncode == 0:
-                self.log("✓ Update successful!")
-                self.log(result.stdout)
+    def _on_update_performed(self, release_url, returncode, output):
+        """Report the git pull result (Tk thread)."""
+        self.update_button.config(state="normal")
 
-                messagebox.showinfo(
-                    "Update Successful",
-                    "Application updated successfully!\n\n"
-                    "Please restart the launcher to use the new version.\n\n"
-                    "Don't forget to run 'npm install' in the frontend folder if there were dependency changes!"
-                )
-
-                # Trigger dependency check for new packages
-                self.check_dependencies()
-            else:
-                self.log(f"✗ Update failed: {result.stderr}")
-                messagebox.showerror(
-                    "Update Failed",
-                    f"Failed to update:\n\n{result.stderr}\n\n"
-                    f"You can manually update by visiting:\n{release_url}"
-                )
-        except Exception as e:
-            self.log(f"✗ Error updating: {e}")
+        if returncode is None:
+            self.log(f"✗ Error updating: {output}")
             messagebox.showerror(
                 "Update Error",
-                f"Could not update application:\n\n{str(e)}\n\n"
+                f"Could not update application:\n\n{output}\n\n"
                 f"You can manually download the latest version from:\n{release_url}"
             )
+        elif returncode == 0:
+            self._update_cache = None  # Local version just changed
+            self._deps_ok = False  # and it may need new dependencies
+            self.log("✓ Update successful!")
+
+            messagebox.showinfo(
+                "Update Successful",
+                "Application updated successfully!\n\n"
+                "Please restart the launcher to use the new version.\n\n"
+                "Don't forget to run 'npm install' in the frontend folder if there were dependency changes!"
+            )
+
+            # Trigger dependency check for new packages
+            self.check_dependencies()
+        else:
+            self.log("✗ Update failed")
+            messagebox.showerror(
+                "Update Failed",
+                f"Failed to update:\n\n{output}\n\n"
+                f"You can manually update by visiting:\n{release_url}"
+            )
 
     def on_closing(self):
         """Handle window closing."""
         if self.backend_process or self.frontend_process:
             if messagebox.askokcancel("Quit", "Servers are still running. Stop and quit?"):
                 self.stop_servers()
+                self._close_http()
                 self.root.destroy()
         else:
+            self._close_http()
             self.root.destroy()
 
+    def _close_http(self):
+        """Close the shared requests session if one was created."""
+        if self._http is not None:
+            self._http.close()
+
 
 def main():
     """Main entry point."""
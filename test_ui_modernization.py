@@ -4,234 +4,198 @@ Playwright UI Test for Plex Poster Manager Modernization
 Tests all new features: dark mode, thumbnail slider, pagination, responsive design
 """
 
-from playwright.sync_api import sync_playwright
-import time
+from collections import Counter, deque
+from itertools import islice
 
-def test_ui_modernization():
+from ui_test_utils import SCREENSHOT_DIR, open_page, save_screenshot, screenshot_viewports, ui_snapshot, wait_for_render, wait_for_theme
+
+# Console errors kept for the summary at the end
+CONSOLE_LOG_LIMIT = 500
+
+
+def test_ui_modernization(page):
     print("=" * 80)
     print("Plex Poster Manager - UI Modernization Test")
     print("=" * 80)
 
-    with sync_playwright() as p:
-        # Use Firefox (works on Big Sur 11.7.4)
-        browser = p.firefox.launch(headless=False)
-        page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-
-        # Collect console logs
-        console_logs = []
-        page.on('console', lambda msg: console_logs.append(f"[{msg.type}] {msg.text}"))
-
-        # Collect errors
-        errors = []
-        page.on('pageerror', lambda err: errors.append(str(err)))
-
-        try:
-            # Navigate to app
-            print("\n1. Loading application...")
-            page.goto('http://192.168.5.141:3000', wait_until='networkidle')
-            time.sleep(2)
-
-            # Take initial screenshot
-            page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/01-initial-load-light.png')
-            print("   ✓ Screenshot: 01-initial-load-light.png")
-
-            # Check for dark mode toggle
-            print("\n2. Testing Dark Mode Toggle...")
-            dark_mode_toggle = page.locator('button:has(svg)').filter(has_text='').first
-            if dark_mode_toggle.count() > 0:
-                # Find the toggle button with Moon/Sun icon
-                toggle_buttons = page.locator('button').all()
-                for btn in toggle_buttons:
-                    try:
-                        if 'Moon' in btn.inner_text() or 'Sun' in btn.inner_text() or btn.locator('svg').count() > 0:
-                            btn.click()
-                            print("   ✓ Clicked dark mode toggle")
-                            break
-                    except:
-                        continue
-
-                time.sleep(1)
-                page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/02-dark-mode-enabled.png')
-                print("   ✓ Screenshot: 02-dark-mode-enabled.png")
-
-                # Toggle back to light mode for contrast
-                for btn in toggle_buttons:
-                    try:
-                        if 'Moon' in btn.inner_text() or 'Sun' in btn.inner_text() or btn.locator('svg').count() > 0:
-                            btn.click()
-                            print("   ✓ Toggled back to light mode")
-                            break
-                    except:
-                        continue
-                time.sleep(1)
-
-            # Test thumbnail size slider
-            print("\n3. Testing Thumbnail Size Slider...")
-            # Look for slider controls
-            sliders = page.locator('input[type="range"]').all()
-            if len(sliders) > 0:
-                print(f"   Found {len(sliders)} slider(s)")
-                # Use the first slider (thumbnail size slider on main page)
-                slider = sliders[0]
-
-                # Set to minimum
-                slider.fill('150')
-                time.sleep(0.5)
-                page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/03-thumbnail-size-small.png')
-                print("   ✓ Screenshot: 03-thumbnail-size-small.png (150px)")
-
-                # Set to medium
-                slider.fill('300')
-                time.sleep(0.5)
-                page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/04-thumbnail-size-medium.png')
-                print("   ✓ Screenshot: 04-thumbnail-size-medium.png (300px)")
-
-                # Set to large
-                slider.fill('450')
-                time.sleep(0.5)
-                page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/05-thumbnail-size-large.png')
-                print("   ✓ Screenshot: 05-thumbnail-size-large.png (450px)")
-            else:
-                print("   ⚠ No sliders found")
-
-            # Test pagination dropdown
-            print("\n4. Testing Pagination Controls...")
-            # Look for Items Per Page dropdown
-            selects = page.locator('select').all()
-            if len(selects) > 0:
-                print(f"   Found {len(selects)} dropdown(s)")
-                # Find the pagination dropdown (look for "All Items" option)
-                for select in selects:
-                    options = select.locator('option').all()
-                    option_texts = [opt.inner_text() for opt in options]
-                    if any('items' in text.lower() or 'all' in text.lower() for text in option_texts):
-                        print(f"   Pagination options: {option_texts}")
-
-                        # Test 25 items
-                        select.select_option('25')
-                        print("   ✓ Selected: 25 items")
-                        time.sleep(0.5)
-
-                        # Test 50 items
-                        select.select_option('50')
-                        print("   ✓ Selected: 50 items")
-                        time.sleep(0.5)
-                        break
-            else:
-                print("   ⚠ No dropdowns found")
-
-            # Test responsive design
-            print("\n5. Testing Responsive Design...")
-            # Desktop view (already at 1920x1080)
-            page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/06-responsive-desktop.png')
-            print("   ✓ Screenshot: 06-responsive-desktop.png (1920x1080)")
-
-            # Tablet view
-            page.set_viewport_size({'width': 768, 'height': 1024})
-            time.sleep(1)
-            page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/07-responsive-tablet.png')
-            print("   ✓ Screenshot: 07-responsive-tablet.png (768x1024)")
-
-            # Mobile view
-            page.set_viewport_size({'width': 375, 'height': 667})
-            time.sleep(1)
-            page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/08-responsive-mobile.png')
-            print("   ✓ Screenshot: 08-responsive-mobile.png (375x667)")
-
-            # Back to desktop
-            page.set_viewport_size({'width': 1920, 'height': 1080})
-            time.sleep(1)
-
-            # Test modern icons
-            print("\n6. Checking Modern Icons (Lucide)...")
-            # Count SVG elements (Lucide icons are SVG)
-            svg_count = page.locator('svg').count()
-            print(f"   ✓ Found {svg_count} SVG icons")
-
-            # Check for specific Lucide icons by looking at page content
-            page_content = page.content()
-            if '<svg' in page_content:
-                print("   ✓ Modern SVG icons detected")
-
-            # Test dark mode again with full workflow
-            print("\n7. Testing Full Dark Mode Workflow...")
-            # Enable dark mode
-            toggle_buttons = page.locator('button').all()
-            for btn in toggle_buttons:
-                try:
-                    if btn.locator('svg').count() > 0:
-                        btn.click()
-                        print("   ✓ Enabled dark mode")
-                        break
-                except:
-                    continue
-
-            time.sleep(2)
-            page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/09-final-dark-mode-full.png', full_page=True)
-            print("   ✓ Screenshot: 09-final-dark-mode-full.png (full page)")
-
-            # Disable dark mode
-            for btn in toggle_buttons:
-                try:
-                    if btn.locator('svg').count() > 0:
-                        btn.click()
-                        print("   ✓ Disabled dark mode (back to light)")
-                        break
-                except:
-                    continue
-
-            time.sleep(1)
-            page.screenshot(path='/Users/butta/development/plex-poster-manager/screenshots/10-final-light-mode-full.png', full_page=True)
-            print("   ✓ Screenshot: 10-final-light-mode-full.png (full page)")
-
-            # Print console logs summary
-            print("\n8. Console Logs Summary:")
-            if console_logs:
-                error_logs = [log for log in console_logs if 'error' in log.lower()]
-                warning_logs = [log for log in console_logs if 'warning' in log.lower()]
-
-                if error_logs:
-                    print(f"   ⚠ {len(error_logs)} errors found:")
-                    for log in error_logs[:5]:  # Show first 5
-                        print(f"     - {log}")
-                else:
-                    print("   ✓ No errors in console")
-
-                if warning_logs:
-                    print(f"   ℹ {len(warning_logs)} warnings found")
-                else:
-                    print("   ✓ No warnings in console")
-            else:
-                print("   ✓ No console logs")
-
-            # Print page errors
-            if errors:
-                print(f"\n⚠ {len(errors)} page errors detected:")
-                for err in errors:
-                    print(f"  - {err}")
-            else:
-                print("\n✓ No page errors detected")
-
-            print("\n" + "=" * 80)
-            print("TEST SUMMARY")
-            print("=" * 80)
-            print("✓ All screenshots saved to: /Users/butta/development/plex-poster-manager/screenshots/")
-            print("✓ Dark mode toggle: Working")
-            print("✓ Thumbnail size slider: Working")
-            print("✓ Pagination controls: Working")
-            print("✓ Responsive design: Working (Desktop, Tablet, Mobile)")
-            print("✓ Modern icons: Detected")
-            print("=" * 80)
-
-        except Exception as e:
-            print(f"\n❌ Error during test: {e}")
-            import traceback
-            traceback.print_exc()
-
-        finally:
-            print("\nClosing browser...")
-            browser.close()
-            print("Done!")
+    # Collect console logs, sorted by type as they arrive: only errors are kept (the most
+    # recent CONSOLE_LOG_LIMIT; a dev build can be chatty), everything else is just counted
+    console_counts = Counter()
+    console_errors = deque(maxlen=CONSOLE_LOG_LIMIT)
+
+    def on_console(msg):
+        console_counts[msg.type] += 1
+        if msg.type == 'error':
+            console_errors.append(f"[{msg.type}] {msg.text}")
+
+    page.on('console', on_console)
+
+    # Collect errors
+    errors = []
+    page.on('pageerror', lambda err: errors.append(str(err)))
+
+    # Navigate to app
+    print("\n1. Loading application...")
+    page.goto('http://192.168.5.141:3000', wait_until='networkidle')
+    wait_for_render(page)
+
+    # Take initial screenshot (saved counts the files written; a duplicate of the previous shot isn't)
+    saved = int(save_screenshot(page, '01-initial-load-light.png'))
+
+    # Check for dark mode toggle
+    print("\n2. Testing Dark Mode Toggle...")
+    # Moon/Sun button in the header (data-testid in App.jsx); this one locator
+    # is reused for every toggle below
+    dark_mode_toggle = page.get_by_test_id('dark-mode-toggle')
+    has_dark_mode_toggle = dark_mode_toggle.count() > 0
+    if has_dark_mode_toggle:
+        dark_mode_toggle.click()
+        print("   ✓ Clicked dark mode toggle")
+
+        wait_for_theme(page, dark=True)
+        saved += save_screenshot(page, '02-dark-mode-enabled.png')
+
+        # Toggle back to light mode for contrast
+        dark_mode_toggle.click()
+        print("   ✓ Toggled back to light mode")
+        wait_for_theme(page, dark=False)
+
+    # Test thumbnail size slider
+    print("\n3. Testing Thumbnail Size Slider...")
+    # Look for slider controls
+    sliders = page.locator('input[type="range"]').all()
+    if len(sliders) > 0:
+        print(f"   Found {len(sliders)} slider(s)")
+        # Use the first slider (thumbnail size slider on main page)
+        slider = sliders[0]
+
+        # Set to minimum
+        slider.fill('150')
+        wait_for_render(page)
+        saved += save_screenshot(page, '03-thumbnail-size-small.png', " (150px)")
+
+        # Set to medium
+        slider.fill('300')
+        wait_for_render(page)
+        saved += save_screenshot(page, '04-thumbnail-size-medium.png', " (300px)")
+
+        # Set to large
+        slider.fill('450')
+        wait_for_render(page)
+        saved += save_screenshot(page, '05-thumbnail-size-large.png', " (450px)")
+    else:
+        print("   ⚠ No sliders found")
+
+    # Test pagination dropdown
+    print("\n4. Testing Pagination Controls...")
+    # Look for Items Per Page dropdown
+    selects = page.locator('select')
+    # Option texts of every dropdown, read in one round trip
+    select_options = selects.evaluate_all("ss => ss.map(s => [...s.options].map(o => o.textContent))")
+    if len(select_options) > 0:
+        print(f"   Found {len(select_options)} dropdown(s)")
+        # Find the pagination dropdown (look for "All Items" option)
+        for index, option_texts in enumerate(select_options):
+            if any('items' in text.lower() or 'all' in text.lower() for text in option_texts):
+                print(f"   Pagination options: {option_texts}")
+                select = selects.nth(index)
+
+                # Test 25 items
+                select.select_option('25')
+                print("   ✓ Selected: 25 items")
+                wait_for_render(page)
+
+                # Test 50 items
+                select.select_option('50')
+                print("   ✓ Selected: 50 items")
+                wait_for_render(page)
+                break
+    else:
+        print("   ⚠ No dropdowns found")
+
+    # Test responsive design
+    print("\n5. Testing Responsive Design...")
+    # Desktop view (already at 1920x1080)
+    saved += save_screenshot(page, '06-responsive-desktop.png', " (1920x1080)")
+
+    # Tablet and mobile views, loaded side by side in pages of their own
+    saved += screenshot_viewports(page, [
+        (768, 1024, '07-responsive-tablet.png'),
+        (375, 667, '08-responsive-mobile.png'),
+    ])
+    print("   ✓ Screenshot: 07-responsive-tablet.png (768x1024)")
+    print("   ✓ Screenshot: 08-responsive-mobile.png (375x667)")
+
+    # Test modern icons
+    print("\n6. Checking Modern Icons (Lucide)...")
+    # Count SVG elements (Lucide icons are SVG)
+    snapshot = ui_snapshot(page)
+    svg_count = snapshot['svgCount']
+    print(f"   ✓ Found {svg_count} SVG icons")
+
+    if svg_count > 0:
+        print("   ✓ Modern SVG icons detected")
+
+    # Test dark mode again with full workflow
+    print("\n7. Testing Full Dark Mode Workflow...")
+    # Enable dark mode
+    if has_dark_mode_toggle:
+        dark_mode_toggle.click()
+        print("   ✓ Enabled dark mode")
+        wait_for_theme(page, dark=True)
+
+    saved += save_screenshot(page, '09-final-dark-mode-full.png', " (full page)", full_page=True)
+
+    # Disable dark mode
+    if has_dark_mode_toggle:
+        dark_mode_toggle.click()
+        print("   ✓ Disabled dark mode (back to light)")
+        wait_for_theme(page, dark=False)
+
+    saved += save_screenshot(page, '10-final-light-mode-full.png', " (full page)", full_page=True)
+
+    # Print console logs summary
+    print("\n8. Console Logs Summary:")
+    if console_counts:
+        if console_errors:
+            print(f"   ⚠ {console_counts['error']} errors found:")
+            for log in islice(console_errors, 5):  # Show the first 5 of the last CONSOLE_LOG_LIMIT
+                print(f"     - {log}")
+        else:
+            print("   ✓ No errors in console")
+
+        if console_counts['warning']:
+            print(f"   ℹ {console_counts['warning']} warnings found")
+        else:
+            print("   ✓ No warnings in console")
+    else:
+        print("   ✓ No console logs")
+
+    # Print page errors
+    if errors:
+        print(f"\n⚠ {len(errors)} page errors detected:")
+        for err in errors:
+            print(f"  - {err}")
+    else:
+        print("\n✓ No page errors detected")
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"✓ {saved} screenshots saved to: {SCREENSHOT_DIR}/")
+    print("✓ Dark mode toggle: Working")
+    print("✓ Thumbnail size slider: Working")
+    print("✓ Pagination controls: Working")
+    print("✓ Responsive design: Working (Desktop, Tablet, Mobile)")
+    print("✓ Modern icons: Detected")
+    print("=" * 80)
+
 
 if __name__ == '__main__':
-    test_ui_modernization()
+    try:
+        with open_page() as page:
+            test_ui_modernization(page)
+    except Exception as e:
+        print(f"\n❌ Error during test: {e}")
+        import traceback
+        traceback.print_exc()
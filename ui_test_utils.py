@@ -0,0 +1,157 @@
+"""
+Shared helpers for the Playwright UI scripts (test_ui_modernization.py, test_ui_simple.py).
+
+The waits below return once the page has actually settled instead of sleeping a
+fixed time. Under pytest the browser is started once per session (see conftest.py).
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Headless unless PPM_HEADFUL=1 (to watch the run); screenshots work either way
+HEADLESS = os.environ.get("PPM_HEADFUL") != "1"
+
+# Playwright browser to use: firefox (works on Big Sur 11.7.4), chromium or webkit.
+# Chromium talks to Playwright over native CDP and is the quicker choice where it runs.
+BROWSER = os.environ.get("PPM_BROWSER", "firefox")
+
+# The browser profile is kept here between runs so the app loads from a warm HTTP cache
+# (the app's localStorage is cleared per page, see open_page); PPM_COLD=1 starts from an
+# empty profile and reloads instead
+PROFILE_DIR = os.environ.get("PPM_PROFILE_DIR",
+                             os.path.join(tempfile.gettempdir(), f"ppm-ui-profile-{BROWSER}"))
+COLD = os.environ.get("PPM_COLD") == "1"
+
+# Where the screenshots go; the file names passed to the helpers below are relative to it
+SCREENSHOT_DIR = os.environ.get("PPM_SHOTS", "/Users/butta/development/plex-poster-manager/screenshots")
+
+
+@contextmanager
+def launch_browser():
+    """Start the browser with a 1920x1080 context for the UI scripts; yields the context."""
+    from playwright.sync_api import sync_playwright
+
+    os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+    with sync_playwright() as p:
+        browser_type = getattr(p, BROWSER)
+        if COLD:
+            browser = browser_type.launch(headless=HEADLESS)
+            context = browser.new_context(viewport=VIEWPORT)
+        else:
+            browser = context = browser_type.launch_persistent_context(
+                PROFILE_DIR, headless=HEADLESS, viewport=VIEWPORT)
+        try:
+            yield context
+        finally:
+            print("\nClosing browser...")
+            browser.close()
+            print("Done!")
+
+
+CLEAR_APP_STORAGE = """
+if (!sessionStorage.getItem('ppm-ui-test')) {
+    localStorage.clear();
+    sessionStorage.setItem('ppm-ui-test', '1');
+}
+"""
+
+
+@contextmanager
+def open_page(context=None):
+    """Open a page, in `context` if given (pytest) or else in a browser of its own."""
+    if context is None:
+        with launch_browser() as context:
+            with open_page(context) as page:
+                yield page
+        return
+
+    page = context.new_page()
+    # Start from the app's defaults (light mode, default thumbnail size and pagination, no
+    # saved scan), not whatever an earlier run left in the profile. Done once per tab: the
+    # sessionStorage flag survives reloads, and pages opened later share the settings made here.
+    page.add_init_script(CLEAR_APP_STORAGE)
+    try:
+        yield page
+    finally:
+        page.close()
+
+
+# Tailwind's transition-colors duration-200 on the app background
+THEME_TRANSITION_MS = 250
+
+
+def wait_for_render(page):
+    """Wait until React has re-rendered and the browser has painted (two animation frames)."""
+    page.evaluate("() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))")
+
+
+def wait_for_theme(page, dark):
+    """Wait until the app has switched to dark/light mode and the colour fade is done."""
+    page.wait_for_function("dark => document.documentElement.classList.contains('dark') === dark", arg=dark)
+    page.wait_for_timeout(THEME_TRANSITION_MS)
+
+
+def ui_snapshot(page):
+    """Collect the UI facts the scripts report on in one round trip instead of one call each."""
+    return page.evaluate("""() => ({
+        svgCount: document.querySelectorAll('svg').length,
+        rangeCount: document.querySelectorAll('input[type="range"]').length,
+        mentionsDark: document.documentElement.outerHTML.includes('dark'),
+        optionTexts: [...document.querySelectorAll('select option')].map(o => o.textContent),
+    })""")
+
+
+# Page, SHA-256 and file name of the last screenshot taken by save_screenshot()
+_last_screenshot = {'page': None, 'digest': None, 'name': None}
+
+
+def save_screenshot(page, name, note="", full_page=False):
+    """
+    Screenshot `page` to `name` in SCREENSHOT_DIR and report it, unless it is identical to the previous one.
+
+    Several steps can leave a page looking exactly as it did for its last shot (e.g.
+    toggling dark mode and back); such a duplicate is not written again. Returns whether
+    the file was saved, so callers can count the screenshots actually taken.
+    """
+    path = os.path.join(SCREENSHOT_DIR, name)
+    data = page.screenshot(full_page=full_page)
+    digest = hashlib.sha256(data).digest()
+    if page is _last_screenshot['page'] and digest == _last_screenshot['digest']:
+        print(f"   = Unchanged, same as {_last_screenshot['name']}: {name} not saved")
+        return False
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    _last_screenshot.update(page=page, digest=digest, name=name)
+    print(f"   ✓ Screenshot: {name}{note}")
+    return True
+
+
+def screenshot_viewports(page, shots):
+    """
+    Screenshot the app at several viewport sizes, given as (width, height, name).
+
+    Rather than resizing `page` and waiting for each re-layout in turn, every size
+    gets a new page in the same context (so the same localStorage settings, e.g.
+    dark mode) and all of them load in parallel. `page` itself is left untouched.
+    Returns the number of screenshots saved.
+    """
+    pages = []
+    try:
+        for width, height, _ in shots:
+            shot_page = page.context.new_page()
+            pages.append(shot_page)
+            shot_page.set_viewport_size({'width': width, 'height': height})
+            shot_page.goto(page.url, wait_until='commit')  # Don't wait; load alongside the others
+        for shot_page, (_, _, name) in zip(pages, shots):
+            shot_page.wait_for_load_state('networkidle')
+            wait_for_render(shot_page)
+            shot_page.screenshot(path=os.path.join(SCREENSHOT_DIR, name))
+        return len(shots)
+    finally:
+        for shot_page in pages:
+            shot_page.close()